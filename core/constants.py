@@ -6,3 +6,7 @@ Schema 定義已移至 core.schemas。
 
 # 中文語言優先順序
 CHINESE_PRIORITY = ["zh-Hant", "zh-TW", "zh-HK", "zh", "zh-Hans", "zh-CN", "zh-SG"]
+
+# 寫出 CSV 時每個批次的列數（Polars 預設為 1024）
+# Reason: 輸出檔案動輒數十萬列，較大的批次可減少多執行緒序列化時的同步次數
+CSV_WRITE_BATCH_SIZE = 65536
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from core.utils import logger, calculate_global_max_geoname_id
 from core.schemas import CITIES_SCHEMA, ADMIN1_SCHEMA
+from core.constants import CSV_WRITE_BATCH_SIZE
 from core.geodata import get_handler, get_all_handlers
 
 
@@ -108,6 +109,10 @@ def update_admin1_data(
     )
 
     max_id = current_max_id
+    # Reason: 各國新資料先收集起來，最後只過濾與合併一次，
+    #         避免每個國家都重新複製整份 admin1 資料
+    new_admin1_frames = []
+    updated_countries = []
 
     # 為每個有 Handler 的國家處理 admin1
     for country_code in handler_countries:
@@ -134,12 +139,8 @@ def update_admin1_data(
                 f"{country_code} admin1 使用的 ID 範圍: {base_id} - {max_id_used}"
             )
 
-            # 移除舊的該國資料
-            admin1_df = admin1_df.filter(
-                ~pl.col("id").str.starts_with(f"{country_code}.")
-            )
-            # 插入新資料（放在最前面）
-            admin1_df = new_admin1.vstack(admin1_df)
+            new_admin1_frames.append(new_admin1)
+            updated_countries.append(country_code)
             logger.info(f"已更新 {country_code} 的 admin1 資料")
 
         except ValueError as e:
@@ -147,6 +148,23 @@ def update_admin1_data(
         except Exception as e:
             logger.error(f"處理 {country_code} admin1 時發生錯誤: {e}")
 
+    if updated_countries:
+        # 移除舊的各國資料，並將新資料插入到最前面
+        # （後處理的國家排在前面，與逐一插入的結果順序相同）
+        admin1_df = pl.concat(
+            [
+                *reversed(new_admin1_frames),
+                admin1_df.filter(
+                    ~pl.any_horizontal(
+                        [
+                            pl.col("id").str.starts_with(f"{country_code}.")
+                            for country_code in updated_countries
+                        ]
+                    )
+                ),
+            ]
+        )
+
     # 儲存 admin1CodesASCII_optimized.txt
     # 確保輸出資料夾存在
     Path(admin1_output).parent.mkdir(parents=True, exist_ok=True)
@@ -211,7 +229,12 @@ def update_cities500_data(
     # 儲存結果
     # 確保輸出資料夾存在
     Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-    cities500_df.write_csv(output_file, separator="\t", include_header=False)
+    cities500_df.write_csv(
+        output_file,
+        separator="\t",
+        include_header=False,
+        batch_size=CSV_WRITE_BATCH_SIZE,
+    )
     logger.info(
         f"cities500.txt 更新完成 ({cities500_df.height} 筆資料)，儲存至 {output_file}"
     )
@@ -2,6 +2,8 @@ import os
 import sys
 import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
@@ -17,16 +19,29 @@ TaiwanHandler = get_handler("TW")
 MUNICIPALITIES = TaiwanHandler.MUNICIPALITIES
 
 
+# 同時進行中的 API 查詢數量上限（實際請求速率仍由 LOCATIONIQ_QPS 限制）
+MAX_WORKERS = 8
+
 s = requests.Session()
 
 retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[403, 500, 502, 503, 504])
 
-s.mount("https://", HTTPAdapter(max_retries=retries))
+# Reason: 連線池大小需與並行查詢數一致，否則多執行緒會互相等待或重複建立連線
+s.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=retries, pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS
+    ),
+)
 
 # 預設值（若沒有設定，可能會在使用時出現錯誤）
 LOCATIONIQ_API_KEY = None
 LOCATIONIQ_QPS = 2  # LocationIQ 免費方案：5,000 次/天，2 次/秒
 
+# 跨執行緒共用的速率限制狀態
+_rate_limit_lock = threading.Lock()
+_next_request_time = 0.0
+
 
 def set_locationiq_config(api_key, qps):
     """
@@ -41,6 +56,22 @@ def set_locationiq_config(api_key, qps):
     LOCATIONIQ_QPS = qps
 
 
+def wait_for_rate_limit():
+    """
+    等待直到可以送出下一個 API 請求，確保所有執行緒合計不超過 LOCATIONIQ_QPS。
+    """
+    global _next_request_time
+
+    with _rate_limit_lock:
+        now = time.monotonic()
+        wait_time = _next_request_time - now
+        # 預約下一個可用的請求時間點
+        _next_request_time = max(now, _next_request_time) + 1.02 / LOCATIONIQ_QPS
+
+    if wait_time > 0:
+        time.sleep(wait_time)
+
+
 def get_loc_from_locationiq(lat, lon):
     """
     使用 LocationIQ API 根據經緯度取得地理位置資訊。
@@ -67,8 +98,8 @@ def get_loc_from_locationiq(lat, lon):
 
     headers = {"accept": "application/json"}
     try:
+        wait_for_rate_limit()
         response = s.get(url, headers=headers, params=params)
-        time.sleep(1.02 / LOCATIONIQ_QPS)
         if response.status_code == 200:
             return response.json()
     except requests.exceptions.RequestException as e:
@@ -187,23 +218,47 @@ def process_file(cities500_file, output_file, country_code, batch_size=100):
     # 篩選指定國家
     specific_country_df = cities_df.filter(pl.col("country_code") == country_code)
 
-    # 初始化空 DataFrame 來儲存 API 查詢結果
-    result_df = pl.DataFrame(schema=GEODATA_SCHEMA)
-    pbar = tqdm(
-        specific_country_df.iter_rows(named=True), total=specific_country_df.height
+    # 如果座標已經存在，跳過查詢；重複的座標只查詢一次
+    # Reason: 相同座標的反向地理編碼結果相同，重複查詢只會浪費 API 額度
+    pending_rows = []
+    for row in specific_country_df.iter_rows(named=True):
+        coord = (row["latitude"], row["longitude"])
+        if coord in existing_coords:
+            continue
+        existing_coords.add(coord)
+        pending_rows.append(row)
+
+    pending_locs = [
+        {"lat": row["latitude"], "lon": row["longitude"]} for row in pending_rows
+    ]
+
+    logger.info(f"待查詢座標數量: {len(pending_rows)}")
+
+    # 讀取臺灣行政區對照表（new_id → 中文名稱），只需讀取一次
+    admin1_names = (
+        dict(
+            pl.read_csv(os.path.join("output", "tw_admin1_map.csv"))
+            .select("new_id", "name")
+            .iter_rows()
+        )
+        if country_code == "TW"
+        else {}
     )
-    for row in pbar:
-        pbar.set_description(f"查詢城市: {row['name']}")
 
-        loc = {"lat": row["latitude"], "lon": row["longitude"]}
+    # 並行執行 API 查詢，結果依原順序回傳
+    # Reason: 查詢時間主要花在網路往返，並行送出可讓請求速率貼近 QPS 上限
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    records = executor.map(reverse_query, pending_locs)
 
-        # 如果座標已經存在，跳過查詢
-        if (loc["lat"], loc["lon"]) in existing_coords:
-            continue
+    # 初始化空 DataFrame 來儲存 API 查詢結果
+    result_df = pl.DataFrame(schema=GEODATA_SCHEMA)
+    pbar = tqdm(zip(pending_rows, pending_locs), total=len(pending_rows))
+    for row, loc in pbar:
+        pbar.set_description(f"查詢城市: {row['name']}")
 
         try:
-            # 執行 API 查詢，返回 Polars DataFrame
-            record_df = reverse_query(loc)
+            # 取得 API 查詢結果（Polars DataFrame）
+            record_df = next(records)
 
             # 如果 API 返回 None，則記錄錯誤並跳過
             if record_df is None or record_df.is_empty():
@@ -228,21 +283,12 @@ def process_file(cities500_file, output_file, country_code, batch_size=100):
 
             # 臺灣特殊處理
             if country_code == "TW":
-                # 讀取臺灣行政區對照表
-                admin1_map = pl.read_csv(
-                    os.path.join("output", "tw_admin1_map.csv"),
-                )
-
-                admin_1 = f"TW.{row['admin1_code']}"
+                admin_1 = admin1_names[f"TW.{row['admin1_code']}"]
 
                 # 直轄市/省轄市
                 if record_df["admin_2"].item() in MUNICIPALITIES:
                     record_df = record_df.with_columns(
-                        pl.lit(
-                            admin1_map.filter(pl.col("new_id") == admin_1)[
-                                "name"
-                            ].item()
-                        ).alias("admin_1"),
+                        pl.lit(admin_1).alias("admin_1"),
                         pl.col("admin_3").alias("admin_2"),
                         pl.col("admin_4").alias("admin_3"),
                         pl.lit(None, dtype=pl.String).alias("admin_4"),
@@ -250,13 +296,7 @@ def process_file(cities500_file, output_file, country_code, batch_size=100):
 
                 # 省轄縣
                 else:
-                    record_df = record_df.with_columns(
-                        pl.lit(
-                            admin1_map.filter(pl.col("new_id") == admin_1)[
-                                "name"
-                            ].item()
-                        ).alias("admin_1")
-                    )
+                    record_df = record_df.with_columns(pl.lit(admin_1).alias("admin_1"))
 
             # 合併結果
             result_df = result_df.vstack(record_df)
@@ -267,12 +307,15 @@ def process_file(cities500_file, output_file, country_code, batch_size=100):
                 result_df = pl.DataFrame(schema=GEODATA_SCHEMA)  # 清空 DataFrame
 
         except Exception as e:
-            # API 出錯時，立即寫入當前累積的數據
+            # API 出錯時，取消尚未執行的查詢並立即寫入當前累積的數據
+            executor.shutdown(wait=False, cancel_futures=True)
             save_to_csv(result_df, output_file)
 
             logger.critical(f"API 錯誤: {e}，座標: {loc}")
             sys.exit(1)
 
+    executor.shutdown()
+
     # 最後一次儲存剩餘的結果，確保剩餘資料被儲存
     if result_df.height > 0:
         save_to_csv(result_df, output_file)
@@ -2,9 +2,14 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+import geopandas as gpd
+import numpy as np
 import polars as pl
+import pyogrio
+import shapely
 from core.utils import logger, fill_admin_columns
 from core.schemas import ADMIN1_SCHEMA, GEODATA_SCHEMA, CITIES_SCHEMA
+from core.constants import CSV_WRITE_BATCH_SIZE
 
 
 class GeoDataHandler(ABC):
@@ -23,6 +28,10 @@ class GeoDataHandler(ABC):
 
     # 基底共用設定，可由子類視需求覆寫
     COORD_DECIMAL_PLACES: int = 8
+    # 依 UTM 區並行計算中心點時的執行緒上限
+    CENTROID_MAX_WORKERS: int = 8
+    # 並行計算中心點時，每個工作區塊的幾何體數量
+    CENTROID_CHUNK_SIZE: int = 10_000
 
     # 子類必須覆寫的類別變數
     COUNTRY_NAME: str = ""
@@ -69,7 +78,7 @@ class GeoDataHandler(ABC):
 
     @classmethod
     def convert_to_cities_schema(
-        cls, csv_path: str, base_geoname_id: int
+        cls, csv_path: str, base_geoname_id: int, save_intermediate: bool = False
     ) -> pl.DataFrame:
         """讀取 CSV 並轉換為 CITIES_SCHEMA 格式（共用實作）。
 
@@ -79,7 +88,7 @@ class GeoDataHandler(ABC):
         3. 檢查必要欄位是否存在
         4. 分配 geoname_id 並映射 admin1_code
         5. 呼叫 build_cities_dataframe 建立輸出
-        6. 寫入暫存檔案並回傳結果
+        6. 回傳結果（需要時另寫入暫存檔案供檢查）
 
         子類通常不需覆寫此方法，而是透過以下鉤子自訂行為：
         - prepare_cities_source: 前處理來源資料
@@ -89,6 +98,8 @@ class GeoDataHandler(ABC):
             csv_path: 輸入 CSV 檔案路徑。
             base_geoname_id: geoname_id 起始值。
                 當整合到現有資料集時，應傳入資料集中的最大 ID + 1 以避免衝突。
+            save_intermediate: 是否將轉換結果寫入
+                output/{country}_geodata_converted.csv 供檢查（預設不寫入）。
 
         Returns:
             符合 CITIES_SCHEMA 的 DataFrame。
@@ -112,7 +123,15 @@ class GeoDataHandler(ABC):
             raise FileNotFoundError(error_msg)
 
         # 讀取 CSV
-        df = fill_admin_columns(pl.read_csv(csv_path))
+        # Reason: extract 輸出的欄位型態固定（僅經緯度為數值），直接指定型態
+        #         可省去 Polars 取樣推斷 schema 的掃描
+        df = fill_admin_columns(
+            pl.read_csv(
+                csv_path,
+                infer_schema=False,
+                schema_overrides={"latitude": pl.Float64, "longitude": pl.Float64},
+            )
+        )
         logger.info(f"成功讀取 CSV，共 {df.height} 筆資料")
 
         # 呼叫前處理鉤子
@@ -135,49 +154,46 @@ class GeoDataHandler(ABC):
         admin1_mapping = cls.get_admin1_mapping(csv_path)
 
         # 生成唯一的 geoname_id
+        # Reason: int_range 直接在 Polars 內產生連續整數，不需先建立 Python list
         df = df.with_columns(
-            pl.Series(
-                "geoname_id",
-                [base_geoname_id + i for i in range(df.height)],
-            ).cast(pl.Int64)
+            (pl.int_range(pl.len(), dtype=pl.Int64) + base_geoname_id).alias(
+                "geoname_id"
+            )
         )
 
-        # 將 admin_1 映射到 admin1_code
+        # 將 admin_1 映射到 admin1_code 的數字/字母部分（"XX.YY" -> "YY"）
+        # Reason: 對照表僅數十筆，先在 Python 端切出代碼後以 replace_strict
+        #         在 Polars 引擎內完成對照，不需逐列呼叫 lambda 再拆分字串
+        admin1_code_map = {
+            name: code.split(".")[-1] for name, code in admin1_mapping.items()
+        }
         df = df.with_columns(
             pl.col("admin_1")
-            .map_elements(
-                lambda name: admin1_mapping.get(name, None),
-                return_dtype=pl.String,
-            )
-            .alias("admin1_code_full")  # 暫存完整代碼 "XX.YY"
+            .replace_strict(admin1_code_map, default=None, return_dtype=pl.String)
+            .alias("admin1_code_mapped")
         )
 
         # 檢查是否有無法映射的 admin_1
-        null_admin1_codes = df.filter(pl.col("admin1_code_full").is_null())
+        null_admin1_codes = df.filter(pl.col("admin1_code_mapped").is_null())
         if null_admin1_codes.height > 0:
             missing_names = null_admin1_codes["admin_1"].unique().to_list()
             logger.warning(
                 f"以下 admin_1 無法映射到 admin1_code（將設為 None）: {missing_names}"
             )
 
-        # 提取 admin1_code 的數字/字母部分（"XX.YY" -> "YY"）
-        df = df.with_columns(
-            pl.when(pl.col("admin1_code_full").is_not_null())
-            .then(pl.col("admin1_code_full").str.split(".").list.last())
-            .otherwise(None)
-            .alias("admin1_code_mapped")
-        )
-
         # 呼叫 build_cities_dataframe 建立輸出
         result = cls.build_cities_dataframe(df)
 
         # 寫入暫存檔案
-        output_path = (
-            Path("output") / f"{cls.COUNTRY_CODE.lower()}_geodata_converted.csv"
-        )
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        result.write_csv(output_path)
-        logger.info(f"已將轉換後的資料暫存至: {output_path}")
+        # Reason: 結果會直接在記憶體中交給 replace_in_dataset 使用，
+        #         暫存 CSV 只用於人工檢查，預設略過這次序列化
+        if save_intermediate:
+            output_path = (
+                Path("output") / f"{cls.COUNTRY_CODE.lower()}_geodata_converted.csv"
+            )
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            result.write_csv(output_path, batch_size=CSV_WRITE_BATCH_SIZE)
+            logger.info(f"已將轉換後的資料暫存至: {output_path}")
 
         logger.info(f"{cls.COUNTRY_NAME} 地理資料轉換完成，共 {result.height} 筆資料")
         logger.info(
@@ -294,6 +310,70 @@ class GeoDataHandler(ABC):
         # 如果所有層級都不足 n 筆，回傳所有去重後的結果
         return result
 
+    @staticmethod
+    def _read_vector_file(
+        shapefile_path: str,
+        columns: list[str],
+    ) -> tuple[gpd.GeoDataFrame, pl.DataFrame]:
+        """讀取向量檔案（Shapefile / GeoJSON）的幾何與屬性欄位。
+
+        以 pyogrio 將資料讀為 NumPy 陣列，幾何只用於計算中心點，
+        屬性欄位則直接建立 Polars DataFrame，不經過 pandas。
+
+        Args:
+            shapefile_path: 向量檔案路徑。
+            columns: 需要讀取的屬性欄位。
+
+        Returns:
+            (僅含幾何欄位的 GeoDataFrame, 屬性欄位的 Polars DataFrame)。
+            屬性欄位的缺值保留為 null，由呼叫端視需求處理。
+        """
+        # Reason: 專案未相依 pyarrow，無法使用 use_arrow；raw.read 回傳
+        #         NumPy 陣列，字串欄位可直接轉為 Polars 而不需 pandas 的
+        #         fillna/astype 前處理
+        meta, _, wkb_geometries, field_data = pyogrio.raw.read(
+            shapefile_path, columns=columns
+        )
+        logger.info(
+            f"成功讀取 {shapefile_path}，資料集大小: {len(wkb_geometries)} 行 x "
+            f"{len(field_data)} 列"
+        )
+        logger.info(f"原始座標系統: {meta['crs']}")
+
+        gdf = gpd.GeoDataFrame(
+            geometry=shapely.from_wkb(wkb_geometries), crs=meta["crs"]
+        )
+        attributes = pl.DataFrame(
+            [
+                pl.Series(name, values, dtype=pl.String)
+                for name, values in zip(meta["fields"], field_data)
+            ]
+        )
+        return gdf, attributes
+
+    @staticmethod
+    def _build_coordinate_frame(
+        longitudes: np.ndarray, latitudes: np.ndarray, attributes: pl.DataFrame
+    ) -> pl.DataFrame:
+        """合併中心點座標與屬性欄位。
+
+        Args:
+            longitudes: 中心點經度陣列。
+            latitudes: 中心點緯度陣列。
+            attributes: 與座標逐列對應的屬性欄位。
+
+        Returns:
+            以 latitude、longitude 開頭的 Polars DataFrame，
+            無法計算的中心點（NaN）轉為 null。
+        """
+        coordinates = pl.DataFrame(
+            [
+                pl.Series("latitude", latitudes, nan_to_null=True),
+                pl.Series("longitude", longitudes, nan_to_null=True),
+            ]
+        )
+        return coordinates.hstack(attributes)
+
     def _save_extract_csv(
         self,
         df: pl.DataFrame,
@@ -303,8 +383,8 @@ class GeoDataHandler(ABC):
         """標準化並儲存 extract 階段產生的 CSV 檔案。
 
         執行標準收尾步驟：
-        1. 全欄位排序
-        2. 移除無效座標
+        1. 移除無效座標
+        2. 全欄位排序
         3. 標準化座標精度
         4. 建立輸出目錄
         5. 寫入 CSV
@@ -331,12 +411,17 @@ class GeoDataHandler(ABC):
                 "longitude",
             ]
 
-        # 全欄位排序可在資料更新時最小化 git diff，便於版本追蹤
-        df = df.sort(sort_columns)
-
-        # 移除無效的資料點
-        df = df.filter(
-            pl.col("longitude").is_not_null() & pl.col("latitude").is_not_null()
+        # 先移除無效的資料點，再進行全欄位排序
+        # Reason: 全欄位排序可在資料更新時最小化 git diff，便於版本追蹤；
+        #         以 lazy 查詢先過濾再排序，排序不必處理會被丟棄的資料列
+        df = (
+            df.lazy()
+            .filter(
+                pl.col("longitude").is_not_null() & pl.col("latitude").is_not_null()
+            )
+            # Reason: 欄位維持字串型態，避免轉為 Categorical 後排序結果不再是字典序
+            .sort(sort_columns)
+            .collect()
         )
 
         # 固定經緯度小數位數以確保輸出穩定性
@@ -347,13 +432,14 @@ class GeoDataHandler(ABC):
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"正在儲存 CSV 檔案: {output_path}")
-        df.write_csv(output_path)
+        df.write_csv(output_path, batch_size=CSV_WRITE_BATCH_SIZE)
         logger.info(f"成功儲存 CSV 檔案，共 {len(df)} 筆資料")
 
         # 顯示多樣化的資料樣本供檢查
-        sample_df = self.get_diverse_sample(df, n=5)
+        # Reason: 取樣需多次 unique，表格字串化也有成本；以 loguru 的 lazy 模式
+        #         延後到確定會輸出時才計算，LOG_LEVEL 高於 INFO 時完全略過
         logger.info("資料預覽（多樣化取樣）：")
-        logger.info(sample_df)
+        logger.opt(lazy=True).info("{}", lambda: self.get_diverse_sample(df, n=5))
 
     @classmethod
     def prepare_cities_source(cls, df: pl.DataFrame) -> pl.DataFrame:
@@ -376,26 +462,31 @@ class GeoDataHandler(ABC):
             ...     @classmethod
             ...     def prepare_cities_source(cls, df: pl.DataFrame) -> pl.DataFrame:
             ...         # 清理 admin 欄位中的 "" 字串
-            ...         for col in ["admin_1", "admin_2", "admin_3", "admin_4"]:
-            ...             if col in df.columns:
-            ...                 df = df.with_columns(
-            ...                     pl.when(pl.col(col) == '""')
-            ...                     .then(None)
-            ...                     .otherwise(pl.col(col))
-            ...                     .alias(col)
-            ...                 )
+            ...         df = df.with_columns(
+            ...             [
+            ...                 pl.when(pl.col(col) == '""')
+            ...                 .then(None)
+            ...                 .otherwise(pl.col(col))
+            ...                 .alias(col)
+            ...                 for col in ["admin_1", "admin_2", "admin_3", "admin_4"]
+            ...                 if col in df.columns
+            ...             ]
+            ...         )
             ...         return df.sort(["admin_1", "admin_2"])
         """
         # 標準化空值：將空字串或 "" 轉為 None
+        # Reason: 所有 admin 欄位合併在同一個 with_columns 中，只需一次查詢計畫
         admin_cols = ["admin_1", "admin_2", "admin_3", "admin_4"]
-        for col in admin_cols:
-            if col in df.columns:
-                df = df.with_columns(
-                    pl.when((pl.col(col) == "") | (pl.col(col) == '""'))
-                    .then(None)
-                    .otherwise(pl.col(col))
-                    .alias(col)
-                )
+        df = df.with_columns(
+            [
+                pl.when((pl.col(col) == "") | (pl.col(col) == '""'))
+                .then(None)
+                .otherwise(pl.col(col))
+                .alias(col)
+                for col in admin_cols
+                if col in df.columns
+            ]
+        )
 
         # 排序以確保輸出穩定性
         sort_cols = [col for col in ["admin_1", "admin_2"] if col in df.columns]
@@ -433,34 +524,30 @@ class GeoDataHandler(ABC):
         """
         from datetime import date
 
-        # 獲取今天的日期字串
-        today_date_str = date.today().strftime("%Y-%m-%d")
-
         # 建立符合 CITIES_SCHEMA 的 DataFrame
-        return pl.DataFrame(
-            {
-                "geoname_id": df["geoname_id"],
-                "name": df["admin_2"],  # 預設使用 admin_2 作為地名
-                "asciiname": df["admin_2"],
-                "alternatenames": None,
-                "latitude": df["latitude"],
-                "longitude": df["longitude"],
-                "feature_class": "A",
-                "feature_code": "ADM2",  # 預設為 admin2 層級
-                "country_code": cls.COUNTRY_CODE,
-                "cc2": None,
-                "admin1_code": df["admin1_code_mapped"],  # 使用 "XX" 部分
-                "admin2_code": None,
-                "admin3_code": None,
-                "admin4_code": None,
-                "population": 0,
-                "elevation": None,
-                "dem": None,
-                "timezone": cls.TIMEZONE,
-                "modification_date": today_date_str,
-            },
-            schema=cls.CITIES_SCHEMA,
-        )
+        # Reason: 以 select 運算式在同一個查詢中產生所有欄位並統一轉型，
+        #         不需逐欄取出 Series 再以 dict 重新組裝
+        return df.select(
+            pl.col("geoname_id"),
+            pl.col("admin_2").alias("name"),  # 預設使用 admin_2 作為地名
+            pl.col("admin_2").alias("asciiname"),
+            pl.lit(None).alias("alternatenames"),
+            pl.col("latitude"),
+            pl.col("longitude"),
+            pl.lit("A").alias("feature_class"),
+            pl.lit("ADM2").alias("feature_code"),  # 預設為 admin2 層級
+            pl.lit(cls.COUNTRY_CODE).alias("country_code"),
+            pl.lit(None).alias("cc2"),
+            pl.col("admin1_code_mapped").alias("admin1_code"),  # 使用 "XX" 部分
+            pl.lit(None).alias("admin2_code"),
+            pl.lit(None).alias("admin3_code"),
+            pl.lit(None).alias("admin4_code"),
+            pl.lit(0).alias("population"),
+            pl.lit(None).alias("elevation"),
+            pl.lit(None).alias("dem"),
+            pl.lit(cls.TIMEZONE).alias("timezone"),
+            pl.lit(date.today()).alias("modification_date"),
+        ).cast(cls.CITIES_SCHEMA)
 
     @classmethod
     def prepare_admin1_source(cls, df: pl.DataFrame) -> pl.DataFrame:
@@ -535,8 +622,8 @@ class GeoDataHandler(ABC):
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
 
-        # 讀取 CSV
-        df = pl.read_csv(csv_path)
+        # 讀取 CSV（admin1 記錄只使用字串欄位，不需推斷型態）
+        df = pl.read_csv(csv_path, infer_schema=False)
 
         # 呼叫前處理鉤子
         df = cls.prepare_admin1_source(df)
@@ -644,10 +731,15 @@ class GeoDataHandler(ABC):
         """
         logger.info(f"正在從 {csv_path} 生成 {cls.COUNTRY_NAME} 的 admin_1 mapping...")
 
-        df = pl.read_csv(csv_path)
-
         # 提取唯一的 admin_1 值並排序
-        admin1_list = sorted(df["admin_1"].unique().to_list())
+        # Reason: 以 scan_csv 延遲讀取，只解析 admin_1 欄位並在引擎內去重，
+        #         不必將整份 CSV 載入記憶體
+        admin1_list = sorted(
+            pl.scan_csv(csv_path)
+            .select(pl.col("admin_1").unique())
+            .collect()["admin_1"]
+            .to_list()
+        )
 
         # 計算需要的位數
         total_count = len(admin1_list)
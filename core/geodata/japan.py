@@ -1,13 +1,23 @@
 """日本地理資料處理器。"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import polars as pl
 import geopandas as gpd
 import pyproj
 import numpy as np
 
 from core.utils import logger
+from core.utils.projection import calculate_projected_centroids
 from core.geodata.base import GeoDataHandler, register_handler
 
+# 停用 PROJ 網路存取，固定使用本機 PROJ 資料庫
+# Reason: 本流程只涉及 WGS84、Albers 與 UTM 之間的轉換，無需額外格網檔；
+#         停用後建立轉換管線時不會嘗試連線下載，離線環境下也能穩定執行
+os.environ["PROJ_NETWORK"] = "OFF"
+pyproj.network.set_network_enabled(False)
+
 
 @register_handler("JP")
 class JapanGeoDataHandler(GeoDataHandler):
@@ -26,6 +36,12 @@ class JapanGeoDataHandler(GeoDataHandler):
     # False: 顯示市名＋區名（例：横浜市中区）- 提供更細緻的行政區資訊
     SEIREI_SHI_CITY_NAME_ONLY = True
 
+    # 以日本為中心的 Albers 等面積圓錐投影（用於決定 UTM 區）
+    ALBERS_CRS = pyproj.CRS.from_proj4(
+        "+proj=aea +lat_1=30 +lat_2=45 +lat_0=37.5 +lon_0=138 "
+        "+x_0=0 +y_0=0 +datum=WGS84 +units=m +no_defs"
+    )
+
     def _get_utm_epsg_from_lon(self, longitude: float) -> int:
         """根據經度計算 UTM 區的 EPSG 代碼。"""
         zone = int((longitude + 180) / 6) + 1
@@ -41,68 +57,79 @@ class JapanGeoDataHandler(GeoDataHandler):
             logger.info("正在轉換到 WGS84...")
             gdf = gdf.to_crs(epsg=4326)
 
-        # 使用 Albers 投影計算準確的中心點經度
-        # Reason: 邊界框平均值對於不規則形狀可能不準確，
-        #         特別是在 UTM 區邊界附近（例如日本的 138°E）
-        logger.info("正在計算準確的幾何中心點（使用 Albers 投影）...")
-
-        # 定義以日本為中心的 Albers 等面積圓錐投影
-        japan_albers = pyproj.CRS.from_proj4(
-            "+proj=aea +lat_1=30 +lat_2=45 +lat_0=37.5 +lon_0=138 "
-            "+x_0=0 +y_0=0 +datum=WGS84 +units=m +no_defs"
-        )
-
-        # 投影到 Albers 並計算中心點
-        gdf_albers = gdf.to_crs(japan_albers)
-        centroids_albers = gdf_albers.geometry.centroid
-
-        # 將中心點轉回 WGS84 以取得準確的經度
-        centroids_wgs84_temp = centroids_albers.to_crs(epsg=4326)
-        center_lons = centroids_wgs84_temp.x
-
-        # 根據準確的中心點經度計算 UTM 區（向量化）
-        logger.info("正在根據中心點經度決定 UTM 區...")
-        utm_zones = ((center_lons + 180) / 6).astype(int) + 1
-        utm_epsgs = 32600 + utm_zones
-
-        # 將 UTM 區資訊加入 GeoDataFrame
-        gdf["_utm_zone"] = utm_zones
-        gdf["_utm_epsg"] = utm_epsgs
-
-        logger.info(f"識別到 {utm_epsgs.nunique()} 個不同的 UTM 區")
-
-        # 建立陣列儲存結果（初始化為 NaN）
-        longitudes = np.full(len(gdf), np.nan)
-        latitudes = np.full(len(gdf), np.nan)
-
-        # 按 UTM 區批次處理（依 UTM EPSG 分組）
-        # Reason: 每個 UTM 區需要不同的投影，
-        #         但在每個區內我們一次處理所有幾何體（向量化）
-        logger.info("正在按 UTM 區批次計算中心點...")
-        for utm_epsg, group_idx in gdf.groupby("_utm_epsg").groups.items():
-            # 取得此 UTM 區的幾何體
-            group_gdf = gdf.iloc[group_idx]
-
-            # 轉換到 UTM 投影（批次操作，非迴圈）
-            group_utm = group_gdf.to_crs(epsg=utm_epsg)
-
-            # 在 UTM 中計算中心點（向量化）
-            centroids_utm = group_utm.geometry.centroid
-
-            # 轉回 WGS84（批次操作）
-            centroids_wgs84 = centroids_utm.to_crs(epsg=4326)
-
-            # 使用向量化的 .x 和 .y 屬性提取座標
-            # Reason: 直接使用 NumPy 陣列運算，無 Python 迴圈
-            longitudes[group_idx] = centroids_wgs84.x.values
-            latitudes[group_idx] = centroids_wgs84.y.values
+        geometries = gdf.geometry.to_numpy()
+        chunk_size = self.CENTROID_CHUNK_SIZE
+
+        # 日本全境約十萬個幾何體，切成固定大小的區塊後以執行緒並行計算
+        # Reason: 座標轉換（PROJ）與中心點計算（GEOS）執行期間會釋放 GIL，
+        #         區塊化後即使大部分幾何體集中在同一個 UTM 區也能分散到多個執行緒；
+        #         各區塊的結果依原順序寫回，與一次計算的結果完全相同
+        with ThreadPoolExecutor(max_workers=self.CENTROID_MAX_WORKERS) as executor:
+            # 使用 Albers 投影計算準確的中心點經度
+            # Reason: 邊界框平均值對於不規則形狀可能不準確，
+            #         特別是在 UTM 區邊界附近（例如日本的 138°E）
+            logger.info("正在計算準確的幾何中心點（使用 Albers 投影）...")
+
+            # 投影到 Albers 計算中心點，並將中心點座標轉回 WGS84 以取得準確的經度
+            # Reason: 只需要中心點經度，直接操作幾何與座標陣列，
+            #         不必建立投影後的 GeoDataFrame 與中心點 GeoSeries
+            chunk_slices = [
+                slice(start, start + chunk_size)
+                for start in range(0, len(geometries), chunk_size)
+            ]
+            albers_results = executor.map(
+                lambda chunk: calculate_projected_centroids(
+                    geometries[chunk], gdf.crs, self.ALBERS_CRS
+                ),
+                chunk_slices,
+            )
+            center_lons = np.concatenate(
+                [np.empty(0)] + [chunk_lons for chunk_lons, _ in albers_results]
+            )
 
-        # 將座標加入 GeoDataFrame（向量化賦值）
-        gdf["longitude"] = longitudes
-        gdf["latitude"] = latitudes
+            # 根據準確的中心點經度計算 UTM 區（向量化）
+            logger.info("正在根據中心點經度決定 UTM 區...")
+            utm_zones = ((center_lons + 180) / 6).astype(np.int32) + 1
+            utm_epsgs = 32600 + utm_zones
+
+            # 以 NumPy 取得唯一的 UTM EPSG 及每筆資料所屬的分組編號
+            # Reason: 分組數量僅 3-5 個，直接操作 NumPy 陣列即可，
+            #         不必為此寫入暫存欄位並建立 pandas groupby 物件
+            unique_epsgs, group_ids = np.unique(utm_epsgs, return_inverse=True)
+
+            logger.info(f"識別到 {len(unique_epsgs)} 個不同的 UTM 區")
+
+            # 建立陣列儲存結果（初始化為 NaN）
+            # Reason: 日本經度約 123°～154°，float32 在此範圍僅有約 1e-5 度的解析度，
+            #         低於輸出的 8 位小數，因此座標維持 float64
+            longitudes = np.full(len(gdf), np.nan, dtype=np.float64)
+            latitudes = np.full(len(gdf), np.nan, dtype=np.float64)
+
+            # 按 UTM 區批次處理（依 UTM EPSG 分組，每組再切成區塊）
+            # Reason: 每個 UTM 區需要不同的投影，
+            #         但在每個區塊內我們一次處理所有幾何體（向量化）
+            logger.info("正在按 UTM 區批次計算中心點...")
+            # Reason: 只需要幾何欄位，直接以位置索引幾何陣列，
+            #         不必以 iloc 切片複製整個 GeoDataFrame 的所有欄位
+            tasks = []
+            for group_id, utm_epsg in enumerate(unique_epsgs):
+                group_idx = np.flatnonzero(group_ids == group_id)
+                for start in range(0, len(group_idx), chunk_size):
+                    tasks.append((int(utm_epsg), group_idx[start : start + chunk_size]))
+
+            results = executor.map(
+                lambda task: calculate_projected_centroids(
+                    geometries[task[1]], gdf.crs, task[0]
+                ),
+                tasks,
+            )
+            for (_, chunk_idx), (chunk_lons, chunk_lats) in zip(tasks, results):
+                longitudes[chunk_idx] = chunk_lons
+                latitudes[chunk_idx] = chunk_lats
 
-        # 清理暫存欄位
-        gdf = gdf.drop(columns=["_utm_zone", "_utm_epsg"])
+        # 將座標一次加入 GeoDataFrame
+        # Reason: assign 只建立一個新資料框，避免逐欄賦值觸發多次區塊合併
+        gdf = gdf.assign(longitude=longitudes, latitude=latitudes)
 
         return gdf
 
@@ -145,11 +172,11 @@ class JapanGeoDataHandler(GeoDataHandler):
             logger.info(f"正在讀取 Shapefile: {shapefile_path}")
 
             # === 步驟 1: 讀取 Shapefile 並計算中心點 ===
-            gdf = gpd.read_file(shapefile_path)
-            logger.info(
-                f"成功讀取 Shapefile，資料集大小: {gdf.shape[0]} 行 x {gdf.shape[1]} 列"
+            # Reason: 只讀取後續使用的屬性欄位，屬性直接建立 Polars DataFrame；
+            #         缺值保留為 null，由後續的空值標準化統一處理
+            gdf, attributes = self._read_vector_file(
+                shapefile_path, columns=["N03_001", "N03_003", "N03_004", "N03_005"]
             )
-            logger.info(f"原始座標系統: {gdf.crs}")
 
             # 使用動態 UTM 區選擇方法（結合 Albers 投影）計算中心點
             # Reason: 日本橫跨多個 UTM 區（53N, 54N, 55N），
@@ -157,16 +184,9 @@ class JapanGeoDataHandler(GeoDataHandler):
             logger.info("使用方法：動態 UTM 區選擇（結合 Albers 投影進行 UTM 區判定）")
             gdf = self._calculate_centroids_utm(gdf)
 
-            # 移除不需要的幾何欄位
-            gdf = gdf.drop(columns=["geometry"])
-
-            # 統一資料型態：將 object 類型轉為字串並填充 NaN
-            for col in gdf.columns:
-                if gdf[col].dtype == "object":
-                    gdf[col] = gdf[col].fillna("").astype(str)
-
-            # 轉換為 Polars DataFrame 以進行高效的資料處理
-            df = pl.from_pandas(gdf)
+            df = self._build_coordinate_frame(
+                gdf["longitude"].to_numpy(), gdf["latitude"].to_numpy(), attributes
+            )
 
             # === 步驟 2: 選擇並標準化欄位 ===
             df = df.select(
@@ -182,36 +202,15 @@ class JapanGeoDataHandler(GeoDataHandler):
 
             # 標準化空值處理：將 null、空字串、"None"、"nan" 統一轉為 None
             # Reason: 原始資料可能包含多種形式的空值表示，
-            #         統一處理後才能正確執行後續的 is_null() 判斷
+            #         統一處理後才能正確執行後續的 is_null() 判斷；
+            #         null 的 is_in 結果為 null，會落入 otherwise 維持 None
             df = df.with_columns(
                 [
-                    pl.when(
-                        pl.col("N03_003").is_not_null()
-                        & (pl.col("N03_003") != "")
-                        & (pl.col("N03_003") != "None")
-                        & (pl.col("N03_003") != "nan")
-                    )
-                    .then(pl.col("N03_003"))
-                    .otherwise(None)
-                    .alias("clean_n03_003"),
-                    pl.when(
-                        pl.col("N03_004").is_not_null()
-                        & (pl.col("N03_004") != "")
-                        & (pl.col("N03_004") != "None")
-                        & (pl.col("N03_004") != "nan")
-                    )
-                    .then(pl.col("N03_004"))
-                    .otherwise(None)
-                    .alias("clean_n03_004"),
-                    pl.when(
-                        pl.col("N03_005").is_not_null()
-                        & (pl.col("N03_005") != "")
-                        & (pl.col("N03_005") != "None")
-                        & (pl.col("N03_005") != "nan")
-                    )
-                    .then(pl.col("N03_005"))
+                    pl.when(~pl.col(column).is_in(["", "None", "nan"]))
+                    .then(pl.col(column))
                     .otherwise(None)
-                    .alias("clean_n03_005"),
+                    .alias(f"clean_{column.lower()}")
+                    for column in ("N03_003", "N03_004", "N03_005")
                 ]
             )
 
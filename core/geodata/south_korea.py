@@ -1,14 +1,16 @@
 """南韓地理資料處理器。"""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import polars as pl
 import geopandas as gpd
-import pyproj
 import numpy as np
+import shapely
 from collections.abc import Callable
 
 from core.utils import logger
+from core.utils.projection import calculate_projected_centroids
 from core.utils.wikidata_translator import (
     TranslationDatasetBuilder,
     WikidataTranslator,
@@ -21,13 +23,20 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
     """南韓地理資料處理器。
 
     資料來源：https://github.com/vuski/admdongkor
-    使用動態 UTM 區選擇方法（結合 Albers 投影）計算中心點。
+    使用動態 UTM 區選擇方法計算中心點。
     """
 
     COUNTRY_NAME = "南韓"
     COUNTRY_CODE = "KR"
     TIMEZONE = "Asia/Seoul"
 
+    # 南韓（含離島）位於 UTM 51N（120°E～126°E）與 52N（126°E～132°E）
+    UTM_WEST_LON = 120.0
+    UTM_BOUNDARY_LON = 126.0
+    UTM_EAST_LON = 132.0
+    UTM_WEST_EPSG = 32651
+    UTM_EAST_EPSG = 32652
+
     CITY_DISTRICT_PATTERN = re.compile(r"^(?P<city>.+?시)(?P<district>.+?(?:구|군))$")
 
     # 廣域市/道名稱對照表（韓文 → 台灣常用繁體中文名稱）
@@ -98,75 +107,90 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
     def _calculate_centroids_utm(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         """使用動態 UTM 區選擇計算中心點（向量化）。
 
-        結合 Albers 投影和動態 UTM 區選擇，提供高精確度的中心點計算。
+        依每個幾何體所在的 UTM 區投影後計算中心點，提供高精確度的結果。
         """
         # 確保使用 WGS84 座標系統
         if gdf.crs.to_epsg() != 4326:
             logger.info("正在轉換到 WGS84...")
             gdf = gdf.to_crs(epsg=4326)
 
-        # 使用 Albers 投影計算準確的中心點經度
-        # Reason: 邊界框平均值對於不規則形狀可能不準確，
-        #         特別是在 UTM 區邊界附近（南韓橫跨 126°E）
-        logger.info("正在計算準確的幾何中心點（使用 Albers 投影）...")
-
-        # 定義以南韓為中心的 Albers 等面積圓錐投影
-        korea_albers = pyproj.CRS.from_proj4(
-            "+proj=aea +lat_1=33 +lat_2=43 +lat_0=37 +lon_0=127.5 "
-            "+x_0=0 +y_0=0 +datum=WGS84 +units=m +no_defs"
-        )
-
-        # 投影到 Albers 並計算中心點
-        gdf_albers = gdf.to_crs(korea_albers)
-        centroids_albers = gdf_albers.geometry.centroid
-
-        # 將中心點轉回 WGS84 以取得準確的經度
-        centroids_wgs84_temp = centroids_albers.to_crs(epsg=4326)
-        center_lons = centroids_wgs84_temp.x
+        # 快速路徑：所有幾何體都落在同一個 UTM 區內時，直接在該區計算中心點
+        # Reason: 中心點必定位於幾何體的經度範圍內，整體範圍在單一 UTM 區時
+        #         每筆資料的 UTM 區都相同，可省去分區流程
+        if len(gdf) > 0:
+            min_lon, _, max_lon, _ = gdf.total_bounds
+            utm_epsg = self._get_utm_epsg_from_lon(min_lon)
+            if utm_epsg == self._get_utm_epsg_from_lon(max_lon):
+                logger.info(f"所有幾何體皆位於單一 UTM 區（EPSG:{utm_epsg}）")
+                longitudes, latitudes = calculate_projected_centroids(
+                    gdf.geometry.to_numpy(), gdf.crs, utm_epsg
+                )
+                return gdf.assign(longitude=longitudes, latitude=latitudes)
 
-        # 根據準確的中心點經度計算 UTM 區（向量化）
+        # 以 WGS84 平面中心點的經度決定 UTM 區（向量化）
+        # Reason: 只需判斷中心點位於 126°E 的哪一側，平面中心點與等面積投影
+        #         中心點的差距僅在公尺等級，直接在 WGS84 計算即可省去一整輪投影；
+        #         相較於邊界框平均值或 representative_point，平面中心點更貼近
+        #         實際中心點，UTM 區邊界附近的判定也更一致
         logger.info("正在根據中心點經度決定 UTM 區...")
-        utm_zones = ((center_lons + 180) / 6).astype(int) + 1
-        utm_epsgs = 32600 + utm_zones
-
-        # 將 UTM 區資訊加入 GeoDataFrame
-        gdf["_utm_zone"] = utm_zones
-        gdf["_utm_epsg"] = utm_epsgs
+        geometries = gdf.geometry.to_numpy()
+        center_lons = shapely.get_x(shapely.centroid(geometries))
+        # Reason: 南韓只橫跨兩個 UTM 區，以 126°E 為界一次比較即可決定 EPSG；
+        #         超出兩區範圍時（資料異常）才退回通用公式。缺少幾何（None）時
+        #         中心點經度為 NaN，不論分到哪一區結果都是 NaN，因此不影響判斷；
+        #         空幾何（如 Polygon()）則會在 get_x 時拋出例外，這裡不處理
+        in_korea_zones = (
+            (center_lons >= self.UTM_WEST_LON) & (center_lons < self.UTM_EAST_LON)
+        ) | np.isnan(center_lons)
+        if in_korea_zones.all():
+            utm_epsgs = np.where(
+                center_lons < self.UTM_BOUNDARY_LON,
+                np.int32(self.UTM_WEST_EPSG),
+                np.int32(self.UTM_EAST_EPSG),
+            )
+        else:
+            logger.warning("部分中心點超出南韓的 UTM 51N/52N 範圍，改用通用公式")
+            utm_zones = ((center_lons + 180) / 6).astype(np.int32) + 1
+            utm_epsgs = 32600 + utm_zones
+        unique_epsgs, zone_ids = np.unique(utm_epsgs, return_inverse=True)
 
-        logger.info(f"識別到 {utm_epsgs.nunique()} 個不同的 UTM 區")
+        logger.info(f"識別到 {len(unique_epsgs)} 個不同的 UTM 區")
 
         # 建立陣列儲存結果（初始化為 NaN）
-        longitudes = np.full(len(gdf), np.nan)
-        latitudes = np.full(len(gdf), np.nan)
+        # Reason: 座標必須維持 float64；float32 在經度 120°～150° 的解析度
+        #         約 1e-5 度（約 1 公尺），無法支撐輸出的 8 位小數精度
+        longitudes = np.full(len(gdf), np.nan, dtype=np.float64)
+        latitudes = np.full(len(gdf), np.nan, dtype=np.float64)
 
-        # 按 UTM 區批次處理（依 UTM EPSG 分組）
+        # 按 UTM 區批次處理（以整數位置索引選取各區的幾何體）
         # Reason: 每個 UTM 區需要不同的投影，
-        #         但在每個區內我們一次處理所有幾何體（向量化）
+        #         但在每個區內我們一次處理所有幾何體（向量化）；
+        #         直接操作幾何陣列，不必建立暫存欄位或切片 GeoDataFrame
         logger.info("正在按 UTM 區批次計算中心點...")
-        for utm_epsg, group_idx in gdf.groupby("_utm_epsg").groups.items():
-            # 取得此 UTM 區的幾何體
-            group_gdf = gdf.iloc[group_idx]
-
-            # 轉換到 UTM 投影（批次操作，非迴圈）
-            group_utm = group_gdf.to_crs(epsg=utm_epsg)
-
-            # 在 UTM 中計算中心點（向量化）
-            centroids_utm = group_utm.geometry.centroid
-
-            # 轉回 WGS84（批次操作）
-            centroids_wgs84 = centroids_utm.to_crs(epsg=4326)
+        # Reason: 位置索引只保存該區的列號，回寫結果時也不需再掃過整個遮罩
+        zone_indices = [
+            np.flatnonzero(zone_ids == zone_id) for zone_id in range(len(unique_epsgs))
+        ]
 
-            # 使用向量化的 .x 和 .y 屬性提取座標
-            # Reason: 直接使用 NumPy 陣列運算，無 Python 迴圈
-            longitudes[group_idx] = centroids_wgs84.x.values
-            latitudes[group_idx] = centroids_wgs84.y.values
+        def _calculate_zone_centroids(utm_epsg, zone_idx):
+            return calculate_projected_centroids(
+                geometries[zone_idx], gdf.crs, int(utm_epsg)
+            )
 
-        # 將座標加入 GeoDataFrame（向量化賦值）
-        gdf["longitude"] = longitudes
-        gdf["latitude"] = latitudes
+        # 各 UTM 區以執行緒並行計算
+        # Reason: PROJ 座標轉換與 GEOS 中心點計算都會釋放 GIL；
+        #         各區使用的 Transformer 互不相同，執行緒之間不會共用
+        max_workers = max(1, min(len(unique_epsgs), self.CENTROID_MAX_WORKERS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _calculate_zone_centroids, unique_epsgs, zone_indices
+            )
+            for zone_idx, (zone_lons, zone_lats) in zip(zone_indices, results):
+                longitudes[zone_idx] = zone_lons
+                latitudes[zone_idx] = zone_lats
 
-        # 清理暫存欄位
-        gdf = gdf.drop(columns=["_utm_zone", "_utm_epsg"])
+        # 將座標一次加入 GeoDataFrame
+        gdf = gdf.assign(longitude=longitudes, latitude=latitudes)
 
         return gdf
 
@@ -220,30 +244,6 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
 
         return df
 
-    def _split_city_district_name(self, name: str) -> tuple[str, str]:
-        """拆分韓文的「市＋區/郡」合併名稱。
-
-        Args:
-            name: sggnm 欄位中的韓文名稱
-
-        Returns:
-            以 (city, district) 形式回傳，若無法拆分則 district 為空字串
-        """
-
-        if not name or "시" not in name:
-            return name, ""
-
-        match = self.CITY_DISTRICT_PATTERN.match(name)
-        if not match:
-            return name, ""
-
-        city = match.group("city")
-        district = match.group("district")
-        if not district.endswith(("구", "군")):
-            return name, ""
-
-        return city, district
-
     def _normalize_city_district_hierarchy(self, df: pl.DataFrame) -> pl.DataFrame:
         """將市＋區合併名稱拆分並調整 admin 層級。"""
 
@@ -253,19 +253,17 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
         if "admin_4" not in df.columns:
             df = df.with_columns(pl.lit(None, dtype=pl.String).alias("admin_4"))
 
+        # 以正規表達式拆分「市＋區/郡」合併名稱；無法拆分時 district 為空字串
+        # Reason: extract_groups 一次取出兩個群組，整段在 Polars 引擎內完成，
+        #         不需對每列呼叫兩次 Python 函式
+        name_parts = pl.col("sggnm").str.extract_groups(
+            self.CITY_DISTRICT_PATTERN.pattern
+        )
         df = df.with_columns(
             [
-                pl.col("sggnm")
-                .map_elements(
-                    lambda name: self._split_city_district_name(name)[0],
-                    return_dtype=pl.String,
-                )
-                .alias("_city_part"),
-                pl.col("sggnm")
-                .map_elements(
-                    lambda name: self._split_city_district_name(name)[1],
-                    return_dtype=pl.String,
-                )
+                name_parts.struct.field("city").alias("_city_part"),
+                name_parts.struct.field("district")
+                .fill_null("")
                 .alias("_district_part"),
             ]
         )
@@ -294,6 +292,27 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
 
         return df.drop(["_city_part", "_district_part"])
 
+    @staticmethod
+    def _build_admin3_expr() -> pl.Expr:
+        """建立從 adm_nm 解析 admin_3（洞/邑/面）的 Polars 表達式。
+
+        adm_nm 的格式為「sidonm sggnm 洞/邑/面」，依序移除開頭的 sidonm
+        與 sggnm 後即為 admin_3。
+
+        Returns:
+            產生 admin_3 欄位的表達式。
+        """
+        # Reason: strip_prefix 支援以欄位作為前綴，整段在 Polars 引擎內完成，
+        #         不需逐列呼叫 Python 函式
+        return (
+            pl.col("adm_nm")
+            .str.strip_prefix(pl.col("sidonm"))
+            .str.strip_chars_start()
+            .str.strip_prefix(pl.col("sggnm"))
+            .str.strip_chars()
+            .alias("admin_3")
+        )
+
     @staticmethod
     def _build_candidate_filter() -> Callable[[str, dict], bool]:
         """建立候選過濾器，排除議會機構等非行政區實體。
@@ -320,6 +339,18 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
             "시청",  # 韓文：市廳
         ]
 
+        # 將所有關鍵字編譯為單一正規表示式
+        # Reason: 每個標籤只需掃描一次，不必對每個關鍵字各做一次子字串比對；
+        #         關鍵字預先轉為小寫，與標籤的 lower() 比對結果與逐一 in 相同
+        excluded_pattern = re.compile(
+            "|".join(re.escape(keyword.lower()) for keyword in EXCLUDED_KEYWORDS)
+        )
+
+        # 已判定過的 QID → 是否保留
+        # Reason: 過濾結果只取決於 QID 的標籤（與地名無關），同一個 QID 常同時
+        #         是多個地名的候選，記住判定結果後重複出現時只需一次字典查詢
+        qid_decisions: dict[str, bool] = {}
+
         def filter_func(name: str, metadata: dict) -> bool:
             """過濾候選項：排除包含議會相關關鍵字的候選。
 
@@ -330,20 +361,27 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
             Returns:
                 True 保留此候選，False 排除此候選
             """
+            qid = metadata.get("qid")
+            if qid in qid_decisions:
+                return qid_decisions[qid]
+
+            keep = True  # 預設保留此候選
             labels = metadata.get("labels", {})
 
             # 檢查所有語言的標籤
             for lang_code, label in labels.items():
-                label_lower = label.lower()
-                for keyword in EXCLUDED_KEYWORDS:
-                    if keyword.lower() in label_lower:
-                        logger.debug(
-                            f"過濾掉候選 {metadata.get('qid')}: "
-                            f"標籤 [{lang_code}] '{label}' 包含關鍵字 '{keyword}'"
-                        )
-                        return False  # 排除此候選
+                match = excluded_pattern.search(label.lower())
+                if match:
+                    logger.debug(
+                        f"過濾掉候選 {qid}: "
+                        f"標籤 [{lang_code}] '{label}' 包含關鍵字 '{match.group()}'"
+                    )
+                    keep = False  # 排除此候選
+                    break
 
-            return True  # 保留此候選
+            if qid:
+                qid_decisions[qid] = keep
+            return keep
 
         return filter_func
 
@@ -380,67 +418,33 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
             logger.info(f"正在讀取 GeoJSON: {shapefile_path}")
 
             # === 步驟 1: 讀取 GeoJSON 並計算中心點 ===
-            gdf = gpd.read_file(shapefile_path)
-            logger.info(
-                f"成功讀取 GeoJSON，資料集大小: {gdf.shape[0]} 行 x {gdf.shape[1]} 列"
+            # Reason: 只讀取需要的屬性欄位，屬性直接建立 Polars DataFrame
+            gdf, attributes = self._read_vector_file(
+                shapefile_path, columns=["sidonm", "sggnm", "adm_nm"]
             )
-            logger.info(f"原始座標系統: {gdf.crs}")
 
-            # 使用動態 UTM 區選擇方法（結合 Albers 投影）計算中心點
+            # 使用動態 UTM 區選擇方法計算中心點
             # Reason: 南韓橫跨多個 UTM 區（51N, 52N），
             #         需要根據每個幾何體的實際位置動態選擇 UTM 區以確保精確度
-            logger.info("使用方法：動態 UTM 區選擇（結合 Albers 投影進行 UTM 區判定）")
+            logger.info("使用方法：動態 UTM 區選擇")
             gdf = self._calculate_centroids_utm(gdf)
 
-            # 移除不需要的幾何欄位
-            gdf = gdf.drop(columns=["geometry"])
-
-            # 統一資料型態：將 object 類型轉為字串並填充 NaN
-            for col in gdf.columns:
-                if gdf[col].dtype == "object":
-                    gdf[col] = gdf[col].fillna("").astype(str)
-
-            # 轉換為 Polars DataFrame 以進行高效的資料處理
-            df = pl.from_pandas(gdf)
-
-            # === 步驟 2: 提取並解析行政區欄位 ===
-            # 先建立所需的基本欄位
-            df = df.select(
-                [
-                    pl.col("latitude"),
-                    pl.col("longitude"),
-                    pl.col("sidonm"),
-                    pl.col("sggnm"),
-                    pl.col("adm_nm"),
-                ]
+            # 合併中心點座標與屬性欄位，缺值一次以 fill_null 填為空字串
+            # Reason: 無法計算中心點的資料最終會在儲存時被移除，
+            #         提前過濾可避免為這些資料進行翻譯查詢
+            df = (
+                self._build_coordinate_frame(
+                    gdf["longitude"].to_numpy(), gdf["latitude"].to_numpy(), attributes
+                )
+                .with_columns(pl.col(pl.String).fill_null(""))
+                .filter(
+                    pl.col("longitude").is_not_null() & pl.col("latitude").is_not_null()
+                )
             )
 
+            # === 步驟 2: 提取並解析行政區欄位 ===
             # 解析 admin_3：從 adm_nm 移除 sidonm 和 sggnm
-            # Reason: Polars 不支援動態模式的 str.replace，需使用 apply 或分步處理
-            def extract_admin3(row):
-                """從完整地名中提取 admin_3（洞/邑/面）。"""
-                adm_nm = row["adm_nm"]
-                sidonm = row["sidonm"]
-                sggnm = row["sggnm"]
-
-                # 移除 sidonm 和 sggnm
-                result = adm_nm.replace(sidonm, "").replace(sggnm, "").strip()
-                return result
-
-            # 使用 map_rows 進行逐列處理
-            df = df.with_columns(
-                [
-                    pl.struct(["adm_nm", "sidonm", "sggnm"])
-                    .map_elements(
-                        lambda row: row["adm_nm"]
-                        .replace(row["sidonm"], "")
-                        .replace(row["sggnm"], "")
-                        .strip(),
-                        return_dtype=pl.String,
-                    )
-                    .alias("admin_3")
-                ]
-            )
+            df = df.with_columns(self._build_admin3_expr())
 
             # === 步驟 2.5: 正規化特殊行政區結構（世宗特別自治市）===
             df = self._normalize_special_admin_structures(df)
@@ -466,9 +470,14 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
                 target_lang="zh-tw",
             )
 
+            # 預先取得唯一的 (sidonm, sggnm) 組合，供建立翻譯資料集使用
+            # Reason: 資料集建構會逐列轉為 dict 並建立 TranslationItem，
+            #         以數百個唯一組合取代數千筆完整資料列，也只需掃描整個資料框一次
+            admin_pairs = df.select("sidonm", "sggnm").unique(maintain_order=True)
+
             # 步驟 3.1: 批次翻譯 Admin_1（廣域市/道）
             admin1_dataset = dataset_builder.build_admin1(
-                df,
+                admin_pairs.select("sidonm").unique(maintain_order=True),
                 name_field="sidonm",
             )
             admin1_results = translator.batch_translate(
@@ -477,38 +486,48 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
                 show_progress=True,
             )
 
-            admin1_lookup: dict[str, dict[str, str | None]] = {}
+            # 以平行串列（欄位）收集翻譯結果，稍後直接建立 join 用的對照表
+            # Reason: 不必為每個名稱建立一個小 dict，也省去之後再拆回欄位的步驟
+            admin1_names: list[str] = []
+            admin1_translated: list[str] = []
+            admin1_qids: dict[str, str] = {}
             for item in admin1_dataset:
                 result = admin1_results.get(item.id, {})
-                translated = result.get("translated", item.original_name)
-                if item.original_name in self.ADMIN1_NAME_MAP:
-                    translated = self.ADMIN1_NAME_MAP[item.original_name]
-                admin1_lookup[item.original_name] = {
-                    "translated": translated,
-                    "qid": result.get("qid"),
-                }
+                admin1_names.append(item.original_name)
+                admin1_translated.append(
+                    self.ADMIN1_NAME_MAP.get(
+                        item.original_name,
+                        result.get("translated", item.original_name),
+                    )
+                )
+                if result.get("qid"):
+                    admin1_qids[item.original_name] = result["qid"]
 
             # 步驟 3.2: 批次翻譯 Admin_2（市/區/郡）
             sejong_parent = "세종특별자치시"
-            sejong_df = df.filter(pl.col("sidonm") == sejong_parent)
-            sejong_lookup: dict[tuple[str, str], str] = {}
-            if sejong_df.height > 0:
-                sejong_names = sejong_df["sggnm"].unique().to_list()
+            sejong_names = admin_pairs.filter(pl.col("sidonm") == sejong_parent)[
+                "sggnm"
+            ].to_list()
+            admin2_parents: list[str] = []
+            admin2_names: list[str] = []
+            admin2_translated: list[str] = []
+            if sejong_names:
                 logger.info(
                     f"世宗特別自治市 Admin_2 直接使用手動對照表（{len(sejong_names)} 筆）"
                 )
                 for korean_name in sejong_names:
                     translated = self.SEJONG_ADMIN2_MAP.get(korean_name)
                     if translated:
-                        sejong_lookup[(sejong_parent, korean_name)] = translated
                         logger.debug(f"  {korean_name} → {translated} (手動對照)")
                     else:
                         logger.warning(f"  {korean_name} 不在手動對照表中，保持原樣")
-                        sejong_lookup[(sejong_parent, korean_name)] = korean_name
+                        translated = korean_name
+                    admin2_parents.append(sejong_parent)
+                    admin2_names.append(korean_name)
+                    admin2_translated.append(translated)
 
-            admin2_source_df = df.filter(pl.col("sidonm") != sejong_parent)
             admin2_dataset = dataset_builder.build_admin2(
-                admin2_source_df,
+                admin_pairs.filter(pl.col("sidonm") != sejong_parent),
                 parent_field="sidonm",
                 name_field="sggnm",
                 deduplicate=True,
@@ -516,9 +535,7 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
 
             parent_qids_map: dict[str, str] = {}
             for item in admin2_dataset:
-                parent_name = item.parent_chain[-1]
-                parent_info = admin1_lookup.get(parent_name)
-                parent_qid = parent_info.get("qid") if parent_info else None
+                parent_qid = admin1_qids.get(item.parent_chain[-1])
                 if parent_qid:
                     parent_qids_map[item.id] = parent_qid
 
@@ -530,53 +547,53 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
                 candidate_filter=candidate_filter,
             )
 
-            admin2_lookup = dict(sejong_lookup)
+            sejong_count = len(admin2_names)
             for item in admin2_dataset:
-                result = admin2_results.get(
-                    item.id,
-                    {
-                        "translated": item.original_name,
-                        "qid": None,
-                        "source": "original",
-                        "used_lang": "original",
-                        "parent_verified": False,
-                    },
-                )
-                admin2_lookup[(item.parent_chain[-1], item.original_name)] = result.get(
-                    "translated", item.original_name
-                )
+                result = admin2_results.get(item.id, {})
+                admin2_parents.append(item.parent_chain[-1])
+                admin2_names.append(item.original_name)
+                admin2_translated.append(result.get("translated", item.original_name))
 
             logger.info(
-                f"Admin_2 翻譯完成，唯一組合: {len(admin2_lookup)} (含手動 {len(sejong_lookup)})"
+                f"Admin_2 翻譯完成，唯一組合: {len(admin2_names)} (含手動 {sejong_count})"
             )
 
-            # 步驟 3.3: 建立對照字典並應用到 DataFrame
+            # 步驟 3.3: 建立對照表並應用到 DataFrame
             logger.info("正在應用翻譯結果...")
 
-            # 建立 Admin_1 對照字典
-            admin1_map = {
-                ko_name: data["translated"] for ko_name, data in admin1_lookup.items()
-            }
-
-            # 應用翻譯到 DataFrame
-            df = df.with_columns(
-                [
-                    pl.col("sidonm")
-                    .map_elements(
-                        lambda x: admin1_map.get(x, x), return_dtype=pl.String
-                    )
-                    .alias("chinese_admin_1"),
-                    pl.struct(["sidonm", "sggnm"])
-                    .map_elements(
-                        lambda row: admin2_lookup.get(
-                            (row["sidonm"], row["sggnm"]), row["sggnm"]
-                        ),
-                        return_dtype=pl.String,
-                    )
-                    .alias("chinese_admin_2"),
-                    # Reason: Admin_3 保留韓文原文以降低 API 請求次數
-                    pl.col("admin_3").alias("chinese_admin_3"),
-                ]
+            # 以 join 套用 Admin_1 翻譯（找不到對照時保留原文）
+            # Reason: Admin_1 只有十餘筆，以小表 join 在 Polars 引擎內完成，
+            #         不需逐列呼叫 Python 函式查詢字典
+            admin1_df = pl.DataFrame(
+                {
+                    "sidonm": admin1_names,
+                    "chinese_admin_1": admin1_translated,
+                },
+                schema={"sidonm": pl.String, "chinese_admin_1": pl.String},
+            )
+            df = df.join(
+                admin1_df, on="sidonm", how="left", maintain_order="left"
+            ).with_columns(pl.col("chinese_admin_1").fill_null(pl.col("sidonm")))
+
+            # 以 (sidonm, sggnm) 為鍵 join 套用 Admin_2 翻譯（找不到對照時保留原文）
+            admin2_df = pl.DataFrame(
+                {
+                    "sidonm": admin2_parents,
+                    "sggnm": admin2_names,
+                    "chinese_admin_2": admin2_translated,
+                },
+                schema={
+                    "sidonm": pl.String,
+                    "sggnm": pl.String,
+                    "chinese_admin_2": pl.String,
+                },
+            )
+            df = df.join(
+                admin2_df, on=["sidonm", "sggnm"], how="left", maintain_order="left"
+            ).with_columns(
+                pl.col("chinese_admin_2").fill_null(pl.col("sggnm")),
+                # Reason: Admin_3 保留韓文原文以降低 API 請求次數
+                pl.col("admin_3").alias("chinese_admin_3"),
             )
 
             # 針對光州移除 Wikidata 消歧義括號
@@ -606,8 +623,8 @@ class SouthKoreaGeoDataHandler(GeoDataHandler):
                 )
 
             # 顯示翻譯統計
-            logger.info(f"Admin_1 翻譯數量: {len(admin1_map)}")
-            logger.info(f"Admin_2 翻譯數量: {len(admin2_lookup)}")
+            logger.info(f"Admin_1 翻譯數量: {len(admin1_names)}")
+            logger.info(f"Admin_2 翻譯數量: {len(admin2_names)}")
             logger.info("Admin_3 保留韓文原文（未翻譯）")
 
             # 重組為標準格式
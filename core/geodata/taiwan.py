@@ -1,9 +1,9 @@
 """臺灣地理資料處理器。"""
 
 import polars as pl
-import geopandas as gpd
 
 from core.utils import logger
+from core.utils.projection import calculate_projected_centroids
 from core.geodata.base import GeoDataHandler, register_handler
 
 
@@ -46,39 +46,21 @@ class TaiwanGeoDataHandler(GeoDataHandler):
 
             logger.info(f"正在讀取 Shapefile: {shapefile_path}")
 
-            # 使用 geopandas 讀取 Shapefile
-            gdf = gpd.read_file(shapefile_path)
-            logger.info(
-                f"成功讀取 Shapefile，資料集大小: {gdf.shape[0]} 行 x {gdf.shape[1]} 列"
+            # 讀取 Shapefile 的幾何與需要的屬性欄位
+            gdf, attributes = self._read_vector_file(
+                shapefile_path, columns=["COUNTYNAME", "TOWNNAME", "VILLNAME"]
             )
 
-            # 檢查原始座標系統
-            logger.info(f"原始座標系統: {gdf.crs}")
-
-            # 先轉換到投影座標系統計算中心點
-            logger.info("正在轉換到投影座標系統 (TWD97 / TM2 zone 121)...")
-            gdf = gdf.to_crs(epsg=3826)
-
-            # 在投影座標系統下計算中心點
-            logger.info("正在計算中心點...")
-            centroids = gdf.geometry.centroid
-
-            # 將中心點轉換回 WGS84
-            logger.info("正在將中心點轉換回 WGS84...")
-            centroids = centroids.to_crs(epsg=4326)
-            gdf["longitude"] = centroids.x
-            gdf["latitude"] = centroids.y
-
-            # 移除 geometry 欄位
-            gdf = gdf.drop(columns=["geometry"])
-
-            # 將所有 object 類型的欄位轉換為字串
-            for col in gdf.columns:
-                if gdf[col].dtype == "object":
-                    gdf[col] = gdf[col].astype(str)
+            # 在投影座標系統 (TWD97 / TM2 zone 121) 下計算中心點並轉換為 WGS84
+            # Reason: 使用快取的 Transformer 直接轉換幾何與中心點座標陣列，
+            #         不必建立投影後的 GeoDataFrame 與中心點 GeoSeries
+            logger.info("正在計算中心點（TWD97 / TM2 zone 121）...")
+            longitudes, latitudes = calculate_projected_centroids(
+                gdf.geometry.to_numpy(), gdf.crs, 3826, dst_crs=4326
+            )
 
-            # 轉換為 Polars DataFrame
-            df = pl.from_pandas(gdf)
+            # 合併經緯度與屬性欄位（屬性已是 Polars 字串欄位，不需再轉型）
+            df = self._build_coordinate_frame(longitudes, latitudes, attributes)
 
             # 選擇需要的欄位並重新命名
             df = df.select(
@@ -1,9 +1,15 @@
 import os
 import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
 from core.utils import logger
 
+# zip 壓縮等級（1 為最快）
+ZIP_COMPRESS_LEVEL = 1
+
 
 def remove_old_releases(output_dir):
     for item in os.listdir(output_dir):
@@ -17,6 +23,26 @@ def remove_old_releases(output_dir):
                 logger.info(f"已刪除檔案: {item_path}")
 
 
+def make_zip_archive(zip_file, root_dir):
+    """將目錄內容壓縮為 zip 檔案。
+
+    Args:
+        zip_file: 輸出的 zip 檔案路徑。
+        root_dir: 要壓縮的目錄，其內容以相對路徑存入壓縮檔。
+    """
+    # Reason: shutil.make_archive 固定使用預設壓縮等級，release 以大型文字檔為主，
+    #         降低壓縮等級可大幅縮短打包時間，檔案大小差異有限
+    root = Path(root_dir)
+    with zipfile.ZipFile(
+        zip_file,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=ZIP_COMPRESS_LEVEL,
+    ) as zf:
+        for path in sorted(root.rglob("*")):
+            zf.write(path, path.relative_to(root).as_posix())
+
+
 def pack(output_dir):
     current_date = datetime.now().strftime("%Y-%m-%d")
     release_name = "release"
@@ -41,13 +67,21 @@ def pack(output_dir):
         "output/cities500_translated.txt": os.path.join(geodata_dir, "cities500.txt"),
     }
 
-    for src, dst in files_to_copy.items():
-        try:
-            shutil.copy(src, dst)
-            logger.info(f"複製 {src} 到 {dst} 成功")
-        except IOError:
-            logger.error(f"複製 {src} 失敗！退出。")
-            exit(1)
+    # Reason: 資料檔只需內容，copyfile 在 Linux 會以 sendfile 於核心內搬移資料，
+    #         並省去 shutil.copy 額外的權限複製（stat + chmod）；
+    #         各檔案互不相依，複製期間會釋放 GIL，以執行緒並行重疊磁碟 I/O
+    with ThreadPoolExecutor(max_workers=len(files_to_copy)) as executor:
+        futures = {
+            executor.submit(shutil.copyfile, src, dst): (src, dst)
+            for src, dst in files_to_copy.items()
+        }
+        for future, (src, dst) in futures.items():
+            try:
+                future.result()
+                logger.info(f"複製 {src} 到 {dst} 成功")
+            except IOError:
+                logger.error(f"複製 {src} 失敗！退出。")
+                exit(1)
 
     # 複製授權相關檔案到 release 根目錄
     license_files = {
@@ -75,7 +109,7 @@ def pack(output_dir):
     )
 
     # 壓縮 release 目錄
-    shutil.make_archive(os.path.join(output_dir, release_name), "zip", release_dir)
+    make_zip_archive(zip_file, release_dir)
     shutil.make_archive(os.path.join(output_dir, release_name), "gztar", release_dir)
 
     logger.info(f"打包完成: {zip_file}")
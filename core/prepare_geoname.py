@@ -1,113 +1,283 @@
+import json
 import os
+import stat
+import sys
 import requests
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from requests.adapters import HTTPAdapter
 
-from core.utils import logger, rebuild_folder
+from core.utils import logger
 
+# 並行下載的最大執行緒數
+DOWNLOAD_MAX_WORKERS = 6
+# 下載時每次寫入的區塊大小（1 MiB）
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# 連線與讀取逾時（秒）
+DOWNLOAD_TIMEOUT = (5, 60)
+# 壓縮檔保留在記憶體中的上限，超過時改寫入暫存檔（64 MiB）
+SPOOL_MAX_SIZE = 64 << 20
+# 記錄各下載網址 ETag / Last-Modified 的檔案名稱（位於資料夾內）
+VALIDATORS_FILE_NAME = ".download_validators.json"
 
-def download_file(url, output_path):
+# Reason: 共用 Session 以保持連線（keep-alive），對同一主機的多個下載
+#         不必重複 TCP/TLS 交握；連線池大小配合並行下載的執行緒數
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=DOWNLOAD_MAX_WORKERS))
+
+# Reason: os.umask 只能以「設定再還原」的方式讀取，且作用於整個行程，
+#         因此在匯入時讀取一次，避免下載執行緒之間互相干擾
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def load_validators(path):
+    """讀取各下載網址上次回應的驗證資訊（ETag / Last-Modified）。
+
+    Args:
+        path: 驗證資訊 JSON 檔路徑。
+
+    Returns:
+        以網址為鍵的驗證資訊字典；檔案不存在或損毀時回傳空字典。
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_validators(path, validators):
+    """將各下載網址的驗證資訊寫回 JSON 檔。"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(validators, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def _open_response(url, cached=None):
+    """發出下載請求，遠端檔案未變更（304）時回傳 None。
+
+    Args:
+        url: 下載網址。
+        cached: 該網址上次成功下載時的驗證資訊；提供時會發出條件式請求。
+
+    Returns:
+        串流模式的回應物件；遠端未變更時為 None。
+    """
+    headers = {}
+    cached = cached or {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = _SESSION.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers=headers)
+    if response.status_code == 304:
+        response.close()
+        return None
+    response.raise_for_status()
+    return response
+
+
+def _response_validators(response):
+    """取出回應的驗證資訊（ETag / Last-Modified）。"""
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+
+def _write_response(response, file):
+    """將回應內容寫入已開啟的二進位檔案物件。"""
+    # Reason: 檔案可達數百 MB，以 1 MiB 區塊寫入可大幅減少 Python 迴圈次數
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        file.write(chunk)
+
+
+def download_file(url, output_path, cached=None):
+    """下載單一檔案。
+
+    Args:
+        url: 下載網址。
+        output_path: 檔案儲存路徑。
+        cached: 上次下載的驗證資訊；提供時以條件式請求確認遠端是否更新。
+
+    Returns:
+        下載成功時為新的驗證資訊；遠端未更新時為 None。
+    """
+    temp_path = None
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        with open(output_path, "wb") as file:
-            for chunk in response.iter_content(chunk_size=1024):
-                file.write(chunk)
+        response = _open_response(url, cached)
+        if response is None:
+            logger.info(f"遠端未更新，跳過下載: {output_path}")
+            return None
+        # Reason: 先寫入同目錄的暫存檔，完整下載後才以 os.replace 取代，
+        #         傳輸中斷時不會覆蓋或截斷既有檔案
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(output_path) or ".",
+            prefix=f".{os.path.basename(output_path)}.",
+            suffix=".part",
+            delete=False,
+        ) as file:
+            temp_path = file.name
+            _write_response(response, file)
+        # NamedTemporaryFile 一律以 0600 建立，取代前還原為一般檔案的權限：
+        # 既有檔案沿用原權限，新檔案則依 umask 決定
+        if os.path.exists(output_path):
+            mode = stat.S_IMODE(os.stat(output_path).st_mode)
+        else:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, output_path)
+        temp_path = None
         logger.info(f"下載完成: {output_path}")
+        return _response_validators(response)
     except requests.RequestException as e:
         logger.error(f"下載失敗: {url} - {e}")
-        exit(1)
+        sys.exit(1)
+    finally:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
 
 
-def unzip_file(zip_path, extract_to):
-    try:
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(extract_to)
-        logger.info(f"解壓完成: {zip_path}")
-    except zipfile.BadZipFile:
-        logger.error(f"解壓失敗: {zip_path}")
-        exit(1)
+def download_and_extract(url, extract_to, expected_file=None, cached=None):
+    """下載 zip 檔並直接解壓到指定目錄，不在目標目錄留下壓縮檔。
+
+    Args:
+        url: zip 檔下載網址。
+        extract_to: 解壓目錄。
+        expected_file: 解壓後應存在的檔案，缺少時視為失敗。
+        cached: 上次下載的驗證資訊；提供時以條件式請求確認遠端是否更新。
 
+    Returns:
+        下載並解壓成功時為新的驗證資訊；遠端未更新時為 None。
+    """
+    # Reason: 壓縮檔只是中繼資料，下載到 SpooledTemporaryFile 後直接解壓，
+    #         小檔完全留在記憶體，大檔才落到暫存檔，省去寫入、重讀與刪除 .zip 的流程
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        try:
+            response = _open_response(url, cached)
+            if response is None:
+                logger.info(f"遠端未更新，跳過下載: {url}")
+                return None
+            _write_response(response, spool)
+            logger.info(f"下載完成: {url}")
+        except requests.RequestException as e:
+            logger.error(f"下載失敗: {url} - {e}")
+            sys.exit(1)
 
-def remove_file(file_path):
-    if os.path.exists(file_path):
-        os.remove(file_path)
-        logger.info(f"已刪除: {file_path}")
+        spool.seek(0)
+        try:
+            with zipfile.ZipFile(spool, "r") as zip_ref:
+                zip_ref.extractall(extract_to)
+            logger.info(f"解壓完成: {url}")
+        except zipfile.BadZipFile:
+            logger.error(f"解壓失敗: {url}")
+            sys.exit(1)
+
+    if expected_file is not None and not os.path.exists(expected_file):
+        logger.error(f"未找到 {expected_file}")
+        sys.exit(1)
+
+    return _response_validators(response)
 
 
 def download(countries=["TW"], update=False):
     TARGET_DIR = "geoname_data"
-    ZIP_FILE = os.path.join(TARGET_DIR, "cities500.zip")
     TXT_FILE = os.path.join(TARGET_DIR, "cities500.txt")
     ADMIN1_FILE = os.path.join(TARGET_DIR, "admin1CodesASCII.txt")
     ADMIN2_FILE = os.path.join(TARGET_DIR, "admin2Codes.txt")
     GEOJSON_FILE = os.path.join(TARGET_DIR, "ne_10m_admin_0_countries.geojson")
+    ALTERNATE_FILE = os.path.join(TARGET_DIR, "alternateNamesV2.txt")
     EXTRA_DATA_DIR = os.path.join(TARGET_DIR, "extra_data")
-
-    if update:
-        rebuild_folder(TARGET_DIR)
+    VALIDATORS_FILE = os.path.join(TARGET_DIR, VALIDATORS_FILE_NAME)
 
     os.makedirs(TARGET_DIR, exist_ok=True)
     os.makedirs(EXTRA_DATA_DIR, exist_ok=True)
 
-    if not os.path.exists(TXT_FILE):
-        download_file(
-            "https://download.geonames.org/export/dump/cities500.zip", ZIP_FILE
-        )
-        unzip_file(ZIP_FILE, TARGET_DIR)
-        remove_file(ZIP_FILE)
-    else:
-        logger.info(f"{TXT_FILE} 已存在，跳過下載。")
+    validators = load_validators(VALIDATORS_FILE)
 
-    for country in countries:
-        country_zip = os.path.join(EXTRA_DATA_DIR, f"{country}.zip")
-        country_txt = os.path.join(EXTRA_DATA_DIR, f"{country}.txt")
-        if not os.path.exists(country_txt):
-            download_file(
-                f"https://download.geonames.org/export/dump/{country}.zip", country_zip
-            )
-            unzip_file(country_zip, EXTRA_DATA_DIR)
-            if not os.path.exists(country_txt):
-                logger.error(f"未找到 {country_txt}")
-                exit(1)
-            remove_file(country_zip)
-        else:
-            logger.info(f"{country_txt} 已存在，跳過下載。")
+    # 先收集需要下載的檔案，再一次並行下載
+    # Reason: 各檔案彼此獨立，耗時主要在網路等待，並行下載的總時間
+    #         約等於最大檔案的下載時間，而非所有檔案下載時間的總和
+    tasks = {}
 
-    if not os.path.exists(ADMIN1_FILE):
-        download_file(
-            "https://download.geonames.org/export/dump/admin1CodesASCII.txt",
-            ADMIN1_FILE,
-        )
-    else:
-        logger.info(f"{ADMIN1_FILE} 已存在，跳過下載。")
+    def schedule(target_file, func, url, *args):
+        # update 時不刪除既有檔案，而是以條件式請求確認遠端是否更新
+        # Reason: 遠端未變更時伺服器回應 304 且不傳送內容，重複更新幾乎不耗流量
+        exists = os.path.exists(target_file)
+        if exists and not update:
+            logger.info(f"{target_file} 已存在，跳過下載。")
+            return
+        cached = validators.get(url) if exists else None
+        tasks[url] = partial(func, url, *args, cached=cached)
 
-    if not os.path.exists(ADMIN2_FILE):
-        download_file(
-            "https://download.geonames.org/export/dump/admin2Codes.txt", ADMIN2_FILE
-        )
-    else:
-        logger.info(f"{ADMIN2_FILE} 已存在，跳過下載。")
+    schedule(
+        TXT_FILE,
+        download_and_extract,
+        "https://download.geonames.org/export/dump/cities500.zip",
+        TARGET_DIR,
+    )
 
-    if not os.path.exists(GEOJSON_FILE):
-        download_file(
-            "https://raw.githubusercontent.com/nvkelso/natural-earth-vector/master/geojson/ne_10m_admin_0_countries.geojson",
-            GEOJSON_FILE,
+    for country in countries:
+        country_txt = os.path.join(EXTRA_DATA_DIR, f"{country}.txt")
+        schedule(
+            country_txt,
+            download_and_extract,
+            f"https://download.geonames.org/export/dump/{country}.zip",
+            EXTRA_DATA_DIR,
+            country_txt,
         )
-    else:
-        logger.info(f"{GEOJSON_FILE} 已存在，跳過下載。")
 
-    alternate_zip = os.path.join(TARGET_DIR, "alternateNamesV2.zip")
-    alternate_txt = os.path.join(TARGET_DIR, "alternateNamesV2.txt")
+    schedule(
+        ADMIN1_FILE,
+        download_file,
+        "https://download.geonames.org/export/dump/admin1CodesASCII.txt",
+        ADMIN1_FILE,
+    )
+    schedule(
+        ADMIN2_FILE,
+        download_file,
+        "https://download.geonames.org/export/dump/admin2Codes.txt",
+        ADMIN2_FILE,
+    )
+    schedule(
+        GEOJSON_FILE,
+        download_file,
+        "https://raw.githubusercontent.com/nvkelso/natural-earth-vector/master/geojson/ne_10m_admin_0_countries.geojson",
+        GEOJSON_FILE,
+    )
+    schedule(
+        ALTERNATE_FILE,
+        download_and_extract,
+        "https://download.geonames.org/export/dump/alternateNamesV2.zip",
+        TARGET_DIR,
+    )
+
+    if tasks:
+        try:
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_MAX_WORKERS) as executor:
+                futures = {url: executor.submit(task) for url, task in tasks.items()}
+            # Reason: 驗證資訊只在檔案完整寫入或解壓後才由主執行緒合併，
+            #         失敗的下載不會被記錄，下次 --update 仍會重新下載
+            error = None
+            for url, future in futures.items():
+                try:
+                    result = future.result()
+                except SystemExit as e:
+                    # 下載函式在記錄錯誤後以 sys.exit 結束，先保留第一個錯誤
+                    error = error or e
+                    continue
+                if result is not None:
+                    validators[url] = result
+        finally:
+            # 已完成的下載即使其他檔案失敗也保留驗證資訊
+            save_validators(VALIDATORS_FILE, validators)
 
-    if not os.path.exists(alternate_txt):
-        download_file(
-            "https://download.geonames.org/export/dump/alternateNamesV2.zip",
-            alternate_zip,
-        )
-        unzip_file(alternate_zip, TARGET_DIR)
-        remove_file(alternate_zip)
-    else:
-        logger.info(f"{alternate_txt} 已存在，跳過下載。")
+        # 任一下載失敗時在此重新拋出並結束程式
+        if error is not None:
+            raise error
 
     logger.info("地理名稱數據下載完成")
 
@@ -124,7 +294,7 @@ def test():
         help="國家代碼，可提供多個代碼，如: TW JP",
     )
     parser.add_argument(
-        "--update", action="store_true", help="刪除現有資料夾並重新下載所有數據"
+        "--update", action="store_true", help="檢查遠端更新並重新下載已變更的數據"
     )
     args = parser.parse_args()
 
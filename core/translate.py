@@ -7,6 +7,7 @@ import opencc
 import polars as pl
 
 from core.schemas import ADMIN1_SCHEMA, GEODATA_SCHEMA, CITIES_SCHEMA
+from core.constants import CSV_WRITE_BATCH_SIZE
 from core.utils import (
     ensure_folder_exists,
     logger,
@@ -18,6 +19,18 @@ from core.utils import (
 converter_t2s = opencc.OpenCC("t2s")
 converter_s2t = opencc.OpenCC("s2t")
 
+# 預先編譯的漢字判斷規則，供 is_chinese / include_chinese 重複使用
+_CHINESE_TEXT_RE = regex.compile(r"^[\p{Script_Extensions=Han}-]+$")
+_HAN_CHAR_RE = regex.compile(r"[\p{Script_Extensions=Han}]")
+
+# 可能包含漢字的字元範圍（供 Polars 預先篩選候選名稱）
+# Reason: Polars（Rust regex）內建的 Unicode 版本較舊，只用 \p{scx=Han}
+#         會漏掉新版才收錄的漢字，因此另外涵蓋 CJK 相關區段，
+#         確保為 include_chinese 判斷結果的超集合
+_HAN_CANDIDATE_PATTERN = (
+    r"[\p{scx=Han}\x{2E80}-\x{33FF}\x{16FE0}-\x{16FFF}\x{20000}-\x{3FFFF}]"
+)
+
 
 def find_duplicate_in_meta(meta_data):
     duplicated_entries = []
@@ -52,7 +65,7 @@ def find_duplicate_in_meta(meta_data):
 def is_chinese(text):
     """判斷給定的文字是否為中文。"""
 
-    return bool(regex.match(r"^[\p{Script_Extensions=Han}-]+$", text))
+    return bool(_CHINESE_TEXT_RE.match(text))
 
 
 def include_chinese(text):
@@ -66,7 +79,7 @@ def include_chinese(text):
         bool: 如果文字包含中文，返回 True，否則返回 False。
     """
 
-    return bool(regex.search(r"[\p{Script_Extensions=Han}]", text))
+    return bool(_HAN_CHAR_RE.search(text))
 
 
 def is_simplified_chinese(text):
@@ -97,6 +110,22 @@ def is_traditional_chinese(text):
     return is_chinese(text) and text == converter_s2t.convert(text)
 
 
+def build_conversion_map(names, convert):
+    """
+    對不重複的名稱各轉換一次，建立原名稱到轉換結果的對照表。
+
+    Args:
+        names (pl.Series): 要轉換的名稱欄位，None 會被略過。
+        convert (Callable[[str], str]): 單一名稱的轉換函式。
+
+    Returns:
+        dict: 原名稱到轉換結果的對照表，可搭配 replace_strict 使用。
+    """
+
+    # Reason: 同一個名稱在資料中大量重複，OpenCC 只需對不重複的字串呼叫一次
+    return {name: convert(name) for name in names.drop_nulls().unique().to_list()}
+
+
 def load_metadata_list(metadata_folder):
     """
     載入指定資料夾中的所有 CSV 檔案，並將其轉換為字典格式。
@@ -108,18 +137,140 @@ def load_metadata_list(metadata_folder):
         dict: 一個字典，其中鍵為 CSV 檔案名稱（不含副檔名），值為對應的資料表。
     """
 
-    metadata_dict = {}
+    file_paths = glob(f"{metadata_folder}/*.csv")
+
+    # Reason: 以 collect_all 一次執行所有 scan_csv 查詢，讓 Polars 平行讀取
+    #         各國的 CSV，而非逐一以 read_csv 依序載入
+    frames = pl.collect_all(
+        [pl.scan_csv(file_path, schema=GEODATA_SCHEMA) for file_path in file_paths]
+    )
+
+    return {
+        os.path.splitext(os.path.basename(file_path))[0]: fill_admin_columns(df)
+        for file_path, df in zip(file_paths, frames)
+    }
+
+
+def build_metadata_translations(meta_data):
+    """
+    將各 metadata 資料表合併為以國家代碼與座標查詢翻譯名稱的對照表。
+
+    Args:
+        meta_data (dict): 以國家代碼為鍵、GEODATA_SCHEMA 資料表為值的字典。
+
+    Returns:
+        pl.DataFrame: 包含 country_code、latitude、longitude 與 translated_name
+        欄位的資料表，每組 (country_code, latitude, longitude) 只有一筆。
+    """
+
+    key_columns = ["country_code", "latitude", "longitude"]
+    if not meta_data:
+        return pl.DataFrame(
+            schema={column: pl.String for column in [*key_columns, "translated_name"]}
+        )
 
-    for file_path in glob(f"{metadata_folder}/*.csv"):
-        key = os.path.splitext(os.path.basename(file_path))[0]
-        metadata_dict[key] = fill_admin_columns(
-            pl.read_csv(
-                file_path,
-                schema=GEODATA_SCHEMA,
+    meta_all = pl.concat(
+        [
+            df.select(
+                pl.lit(country, dtype=pl.String).alias("country_code"),
+                "latitude",
+                "longitude",
+                "admin_2",
             )
+            for country, df in meta_data.items()
+        ]
+    ).unique(subset=key_columns, keep="first", maintain_order=True)
+
+    def convert_name(item):
+        if not is_chinese(item):
+            return None
+        if is_simplified_chinese(item):
+            return converter_s2t.convert(item)
+        return item
+
+    name_map = build_conversion_map(meta_all["admin_2"], convert_name)
+
+    return meta_all.select(
+        *key_columns,
+        pl.col("admin_2")
+        .replace_strict(name_map, default=None, return_dtype=pl.String)
+        .alias("translated_name"),
+    )
+
+
+def extract_chinese_names(alternatenames):
+    """
+    從逗號分隔的替代名稱中選出中文名稱。
+
+    優先順序為：第一個繁體中文名稱 > 第一個簡體中文名稱（轉為繁體）>
+    第一個包含中文的名稱。
+
+    Args:
+        alternatenames (pl.Series): 逗號分隔的替代名稱欄位。
+
+    Returns:
+        pl.Series: 與輸入等長的中文名稱欄位，沒有中文候選時為 None。
+    """
+
+    # 拆分為 (列索引, 原始順序, 候選名稱)，並只保留可能包含漢字的候選
+    candidates = (
+        alternatenames.rename("candidate")
+        .to_frame()
+        .with_row_index("row_idx")
+        .with_columns(pl.col("candidate").str.split(","))
+        .explode("candidate")
+        .with_row_index("position")
+        # Reason: is_chinese 允許連字號，只由連字號組成的候選也會被視為中文，
+        #         因此一併保留以維持原本的判斷結果
+        .filter(
+            pl.col("candidate").str.contains(_HAN_CANDIDATE_PATTERN)
+            | pl.col("candidate").str.contains(r"^-+$")
+        )
+    )
+
+    # 每個不重複的候選只判斷一次：0 = 繁體、1 = 簡體、2 = 其他包含中文者
+    # Reason: 相同的替代名稱在各城市間大量重複，簡繁判斷（OpenCC）
+    #         只需對不重複的字串執行，不必逐列逐候選呼叫 Python
+    rank_map = {}
+    name_map = {}
+    for candidate in candidates["candidate"].unique().to_list():
+        if is_traditional_chinese(candidate):
+            rank_map[candidate] = 0
+            name_map[candidate] = candidate
+        elif is_simplified_chinese(candidate):
+            rank_map[candidate] = 1
+            name_map[candidate] = converter_s2t.convert(candidate)
+        elif include_chinese(candidate):
+            rank_map[candidate] = 2
+            name_map[candidate] = candidate
+
+    # 依 (優先順序, 原始順序) 取每列的第一個候選
+    selected = (
+        candidates.with_columns(
+            pl.col("candidate")
+            .replace_strict(rank_map, default=None, return_dtype=pl.UInt8)
+            .alias("rank"),
+            pl.col("candidate")
+            .replace_strict(name_map, default=None, return_dtype=pl.String)
+            .alias("translated"),
         )
+        .filter(pl.col("rank").is_not_null())
+        .sort(["row_idx", "rank", "position"])
+        .unique(subset="row_idx", keep="first", maintain_order=True)
+    )
 
-    return metadata_dict
+    return (
+        pl.int_range(alternatenames.len(), dtype=pl.UInt32, eager=True)
+        .alias("row_idx")
+        .to_frame()
+        .join(
+            selected.select("row_idx", "translated"),
+            on="row_idx",
+            how="left",
+            maintain_order="left",
+        )
+        .get_column("translated")
+    )
 
 
 def process_multiple_names(row, res):
@@ -184,146 +335,92 @@ def translate_cities500(
     )
 
     # 1.  先處理 meta_data 匹配
-    def translate_from_metadata(row):
-        country = row["country_code"]
-
-        # 確保 country 存在於 meta_data
-        if country not in meta_data:
-            return None
-
-        # 在 meta_data[country] DataFrame 中查找對應的 (latitude, longitude)
-        result = meta_data[country].filter(
-            (pl.col("latitude") == row["latitude"])
-            & (pl.col("longitude") == row["longitude"])
-        )
-
-        # 如果有匹配的行，取出 admin_2
-        if not result.is_empty():
-            item = result["admin_2"].item()
-            if not is_chinese(item):
-                return None
-            if is_simplified_chinese(item):
-                return converter_s2t.convert(item)
-            return item
-
-        return None  # 若無匹配則回傳 None
-
-    cities500_df = cities500_df.with_columns(
-        pl.struct(["country_code", "latitude", "longitude"])
-        .map_elements(translate_from_metadata, return_dtype=pl.String)
-        .alias("translated_name")
+    # Reason: 以 (country_code, latitude, longitude) 進行 hash join，
+    #         取代逐列呼叫 Python 並在 metadata 中過濾座標的做法
+    cities500_df = cities500_df.join(
+        build_metadata_translations(meta_data),
+        on=["country_code", "latitude", "longitude"],
+        how="left",
+        maintain_order="left",
     )
 
     # 2. 透過 alternate_name 進行翻譯
-    cities500_df = (
-        cities500_df.join(alternate_name, on="geoname_id", how="left")
-        .with_columns(
-            pl.col("name_right")
-            .map_elements(
-                lambda x: x if is_traditional_chinese(x) else converter_s2t.convert(x),
-                return_dtype=pl.String,
-            )
-            .alias("alternate_translated_name")
-        )
-        .drop("name_right")
+    # Reason: alternate_name 涵蓋所有 GeoNames 地點，先只保留 cities500
+    #         出現的 geoname_id，可大幅縮小 join 右側的雜湊表
+    alternate_name = alternate_name.filter(
+        pl.col("geoname_id").is_in(cities500_df["geoname_id"])
     )
-
-    # 3. 如果 `alternatenames` 存在，則檢查是否有簡體或繁體的名稱
-    def extract_chinese_names(alt_names):
-        if not alt_names:
-            return None
-        candidates = alt_names.split(",")
-
-        simplified_candidate = None  # 第一個簡體中文候選
-        generic_candidate = None  # 第一個包含中文的候選
-
-        for w in candidates:
-            # 優先返回繁體中文的候選
-            if is_traditional_chinese(w):
-                return w
-            # 若還沒找到簡體中文候選則記錄第一個簡體中文
-            elif is_simplified_chinese(w) and simplified_candidate is None:
-                simplified_candidate = w
-            # 記錄第一個包含中文的候選
-            elif include_chinese(w) and generic_candidate is None:
-                generic_candidate = w
-
-        if simplified_candidate is not None:
-            # 返回轉換成繁體的簡體候選
-            return converter_s2t.convert(simplified_candidate)
-        elif generic_candidate is not None:
-            return generic_candidate
-        else:
-            return None
-
-    cities500_df = cities500_df.with_columns(
-        pl.col("alternatenames")
-        .map_elements(extract_chinese_names, return_dtype=pl.String)
-        .alias("alternatenames_translated")
+    cities500_df = cities500_df.join(alternate_name, on="geoname_id", how="left")
+    alternate_map = build_conversion_map(
+        cities500_df["name_right"],
+        lambda x: x if is_traditional_chinese(x) else converter_s2t.convert(x),
     )
+    cities500_df = cities500_df.with_columns(
+        pl.col("name_right")
+        .replace_strict(alternate_map, default=None, return_dtype=pl.String)
+        .alias("alternate_translated_name")
+    ).drop("name_right")
 
-    # 將 "" 轉換為 None，以便 coalesce 時能夠正確處理
+    # 3. 如果 `alternatenames` 存在，則檢查是否有簡體或繁體的名稱
     cities500_df = cities500_df.with_columns(
-        [
-            pl.when(pl.col(col).cast(pl.String) == "")
-            .then(None)
-            .otherwise(pl.col(col))
-            .alias(col)
-            for col in cities500_df.schema
-            if cities500_df.schema[col] == pl.String
-        ]
+        extract_chinese_names(cities500_df["alternatenames"]).alias(
+            "alternatenames_translated"
+        )
     )
 
-    # 4. 選擇最終翻譯名稱（優先順序: metadata > alternate > alternatenames）
-    cities500_df = cities500_df.with_columns(
-        pl.coalesce(
+    # Reason: 以下步驟皆為純 Polars 運算，串成單一 LazyFrame 查詢後一次
+    #         collect，避免每個步驟都產生完整的中間資料表；前面需要呼叫
+    #         OpenCC 建立對照表的步驟必須先取得實際資料，因此維持 eager
+    string_columns = [
+        col for col, dtype in cities500_df.schema.items() if dtype == pl.String
+    ]
+    cities500_df = (
+        cities500_df.lazy()
+        # 將 "" 轉換為 None，以便 coalesce 時能夠正確處理
+        .with_columns(
+            [
+                pl.when(pl.col(col) == "").then(None).otherwise(pl.col(col)).alias(col)
+                for col in string_columns
+            ]
+        )
+        # 4. 選擇最終翻譯名稱（優先順序: metadata > alternate > alternatenames）
+        #    台灣資料直接使用原始 name
+        .with_columns(
+            pl.when(pl.col("country_code") == "TW")
+            .then(pl.col("name"))
+            .otherwise(
+                pl.coalesce(
+                    [
+                        "translated_name",
+                        "alternate_translated_name",
+                        "alternatenames_translated",
+                    ]
+                )
+            )
+            .alias("final_name")
+        )
+        .drop(
             [
                 "translated_name",
                 "alternate_translated_name",
                 "alternatenames_translated",
             ]
-        ).alias("final_name_temp")  # 使用臨時名稱
-    )
-
-    # 4.5. 台灣特殊處理：直接使用原始 name
-    cities500_df = cities500_df.with_columns(
-        pl.when(pl.col("country_code") == "TW")
-        .then(pl.col("name"))  # 台灣資料直接使用原始 name
-        .otherwise(pl.col("final_name_temp"))  # 其他國家使用 coalesce 結果
-        .alias("final_name")  # 這是最終確定的名稱
-    ).drop(
-        [
-            "translated_name",
-            "alternate_translated_name",
-            "alternatenames_translated",
-            "final_name_temp",
-        ]
-    )
-
-    # 5. 記錄未處理的行 (現在判斷 final_name)
-    unprocessed = cities500_df.filter(pl.col("final_name").is_null())
-    if not unprocessed.is_empty():
-        # for row in unprocessed.iter_rows(named=True):
-        #     logger.warning(f"未處理的行: {row['geoname_id']} {row['name']}")
-        logger.warning(f"未翻譯的地名數量 (final_name is null): {unprocessed.height}")
-
-    # 6. 處理例外情況 (應用於 final_name)
-    #  裏 -> 里
-    # 先確保 final_name 不是 None 且是字串
-    cities500_df = cities500_df.with_columns(
-        pl.when(
-            pl.col("final_name").is_not_null() & pl.col("final_name").str.contains("裏")
         )
-        .then(pl.col("final_name").str.replace("裏", "里"))
-        .otherwise(pl.col("final_name"))
-        .alias("final_name")
+        # 6. 處理例外情況 (應用於 final_name)：裏 -> 里
+        .with_columns(pl.col("final_name").str.replace("裏", "里"))
+        # 7. 更新 name 和 asciiname (如果 final_name 有值，則使用它；否則保留原始 name)
+        .with_columns(
+            pl.coalesce(["final_name", "name"]).alias("name"),
+            pl.coalesce(["final_name", "name"]).alias("asciiname"),
+        )
+        .collect()
     )
 
-    # 7. 更新 name 和 asciiname (如果 final_name 有值，則使用它；否則保留原始 name)
-    cities500_df = cities500_df.with_columns(
-        pl.coalesce(["final_name", "name"]).alias("name"),
-        pl.coalesce(["final_name", "name"]).alias("asciiname"),
-    ).drop("final_name")
+    # 5. 記錄未處理的行 (final_name 為 None)
+    unprocessed_count = cities500_df["final_name"].null_count()
+    if unprocessed_count:
+        logger.warning(f"未翻譯的地名數量 (final_name is null): {unprocessed_count}")
+    cities500_df = cities500_df.drop("final_name")
 
     # 8. 紀錄空地名的行
     empty_names = cities500_df.filter(
@@ -333,7 +430,12 @@ def translate_cities500(
         logger.error(f"空地名數量: {empty_names.height}")
 
     # 9. 儲存
-    cities500_df.write_csv(output_file, separator="\t", include_header=False)
+    cities500_df.write_csv(
+        output_file,
+        separator="\t",
+        include_header=False,
+        batch_size=CSV_WRITE_BATCH_SIZE,
+    )
 
     logger.info(f"已翻譯 cities500，結果已儲存至 {output_file}")
 
@@ -386,22 +488,22 @@ def translate_admin1(input_file, alternate_name_file, output_folder):
     # 4. 同時更新第2列（索引1）和第3列（索引2）
 
     # 創建映射 Series
+    alternate_name = alternate_name.filter(pl.col("geoname_id").is_in(df["geoname_id"]))
     df = df.join(alternate_name, on="geoname_id", how="left")
 
     # 應用繁體轉換，僅處理有效值
-    def convert_admin_name(name_right, name):
-        if name_right is None or name_right == "":
-            return name
-        elif is_simplified_chinese(name_right):
-            return converter_s2t.convert(name_right)
-        else:
-            return name_right
+    admin_name_map = build_conversion_map(
+        df["name_right"],
+        lambda x: converter_s2t.convert(x) if is_simplified_chinese(x) else x,
+    )
 
     df = df.with_columns(
-        pl.struct(["name_right", "name"])
-        .map_elements(
-            lambda row: convert_admin_name(row["name_right"], row["name"]),
-            return_dtype=pl.String,
+        pl.when(pl.col("name_right").is_null() | (pl.col("name_right") == ""))
+        .then(pl.col("name"))
+        .otherwise(
+            pl.col("name_right").replace_strict(
+                admin_name_map, default=None, return_dtype=pl.String
+            )
         )
         .alias("name")
     ).drop("name_right")
@@ -409,7 +511,12 @@ def translate_admin1(input_file, alternate_name_file, output_folder):
     df = df.with_columns(pl.col("name").alias("asciiname"))
 
     # 寫回文件
-    df.write_csv(output_file, separator="\t", include_header=False)
+    df.write_csv(
+        output_file,
+        separator="\t",
+        include_header=False,
+        batch_size=CSV_WRITE_BATCH_SIZE,
+    )
 
     logger.info(f"翻譯文件已儲存至 {output_file}")
 
@@ -0,0 +1,112 @@
+"""
+座標投影工具模組。
+
+提供快取的 pyproj Transformer 與幾何批次投影功能，
+避免每次 to_crs 都重新建立 PROJ 轉換管線。
+"""
+
+from functools import cache
+
+import geopandas as gpd
+import numpy as np
+import pyproj
+import shapely
+
+
+@cache
+def get_transformer(src_crs, dst_crs) -> pyproj.Transformer:
+    """取得兩個座標系統之間的 Transformer（結果會被快取）。
+
+    Args:
+        src_crs: 來源座標系統（EPSG 代碼或 pyproj.CRS）。
+        dst_crs: 目標座標系統（EPSG 代碼或 pyproj.CRS）。
+
+    Returns:
+        以 (x, y) = (經度, 緯度) 順序運作的 Transformer。
+
+    Example:
+        >>> transformer = get_transformer(4326, 32652)
+        >>> x, y = transformer.transform(127.0, 37.5)
+    """
+    # Reason: 建立 Transformer 需要查詢 PROJ 資料庫並組裝轉換管線，
+    #         成本遠高於實際的座標轉換，重複使用可省去這段開銷
+    return pyproj.Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+@cache
+def _is_same_crs(src_crs, dst_crs) -> bool:
+    """判斷兩個座標系統是否相同（忽略座標軸順序，結果會被快取）。"""
+    return pyproj.CRS.from_user_input(src_crs).equals(dst_crs, ignore_axis_order=True)
+
+
+def transform_geometry_array(geometries: np.ndarray, src_crs, dst_crs) -> np.ndarray:
+    """使用快取的 Transformer 投影 shapely 幾何陣列。
+
+    Args:
+        geometries: shapely 幾何物件的 numpy 陣列。
+        src_crs: 來源座標系統（EPSG 代碼或 pyproj.CRS）。
+        dst_crs: 目標座標系統（EPSG 代碼或 pyproj.CRS）。
+
+    Returns:
+        投影後的幾何陣列。
+    """
+    transformer = get_transformer(src_crs, dst_crs)
+
+    def _transform_coords(coords: np.ndarray) -> np.ndarray:
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack([xs, ys])
+
+    # shapely.transform 會一次取出所有頂點座標並呼叫 _transform_coords 一次
+    return shapely.transform(geometries, _transform_coords)
+
+
+def transform_geometries(geoseries: gpd.GeoSeries, dst_crs) -> gpd.GeoSeries:
+    """使用快取的 Transformer 將 GeoSeries 投影到指定座標系統。
+
+    行為等同 `GeoSeries.to_crs(dst_crs)`，但 Transformer 會跨呼叫重複使用。
+
+    Args:
+        geoseries: 已設定 crs 的 GeoSeries。
+        dst_crs: 目標座標系統（EPSG 代碼或 pyproj.CRS）。
+
+    Returns:
+        投影後的 GeoSeries（保留原索引）。
+    """
+    projected = transform_geometry_array(geoseries.to_numpy(), geoseries.crs, dst_crs)
+    return gpd.GeoSeries(projected, index=geoseries.index, crs=dst_crs)
+
+
+def calculate_projected_centroids(
+    geometries: np.ndarray, src_crs, projected_crs, dst_crs=None
+) -> tuple[np.ndarray, np.ndarray]:
+    """在投影座標系統中計算中心點，並以指定座標系統回傳座標。
+
+    Args:
+        geometries: shapely 幾何物件的 numpy 陣列（來源座標系統）。
+        src_crs: 來源座標系統（EPSG 代碼或 pyproj.CRS）。
+        projected_crs: 計算中心點所用的投影座標系統。
+        dst_crs: 回傳座標的座標系統，預設與來源相同。
+
+    Returns:
+        (x, y) 座標陣列。
+    """
+    # Reason: 來源已是指定的投影座標系統時（例如資料本身即為 TWD97 / TM2），
+    #         直接計算中心點即可，不必把每個多邊形的所有頂點送進 PROJ
+    if _is_same_crs(src_crs, projected_crs):
+        projected = geometries
+    else:
+        projected = transform_geometry_array(geometries, src_crs, projected_crs)
+    centroids = shapely.centroid(projected)
+
+    # 只需要座標，直接以 Transformer 將中心點座標陣列轉到目標座標系統
+    # Reason: 不必建立 Point 幾何的 GeoSeries 再投影
+    to_dst = get_transformer(projected_crs, src_crs if dst_crs is None else dst_crs)
+    return to_dst.transform(shapely.get_x(centroids), shapely.get_y(centroids))
+
+
+__all__ = [
+    "calculate_projected_centroids",
+    "get_transformer",
+    "transform_geometries",
+    "transform_geometry_array",
+]
@@ -742,6 +742,12 @@ class TranslationCacheStore:
         max_dirty: int = 20,
         max_interval: float = 30.0,
     ) -> None:
+        # 沒有任何異動時不需寫檔（即使 force=True）
+        # Reason: 重複執行時所有項目都會命中快取，此時重寫整份 JSON 快取
+        #         只是多餘的序列化與磁碟 I/O
+        if self._dirty == 0:
+            return
+
         if not self.cache_path:
             self._dirty = 0
             self._last_flush = time.time()
@@ -295,7 +295,7 @@ def main():
         help="國家代碼，可提供多個代碼，如: TW JP",
     )
     parser_prepare.add_argument(
-        "--update", action="store_true", help="刪除現有資料並重新下載"
+        "--update", action="store_true", help="檢查遠端更新並重新下載已變更的資料"
     )
     parser_prepare.set_defaults(func=cmd_prepare)
 
@@ -390,7 +390,7 @@ def main():
     # release 子命令 (依序執行所有步驟，可設定跳過部份步驟)
     parser_release = subparsers.add_parser("release", help="依序執行所有步驟")
     parser_release.add_argument(
-        "--update-prepare", action="store_true", help="prepare 時重新下載資料"
+        "--update-prepare", action="store_true", help="prepare 時檢查並下載已更新的資料"
     )
     parser_release.add_argument(
         "--data-folder", type=str, default="./geoname_data", help="原始資料夾"
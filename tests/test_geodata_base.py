@@ -1,5 +1,8 @@
 """GeoDataHandler 基類的單元測試。"""
 
+import json
+
+import numpy as np
 import polars as pl
 from core.geodata.base import GeoDataHandler
 
@@ -184,3 +187,84 @@ class TestGetDiverseSample:
         # 應該能正常處理 null 值
         assert len(result) <= 5
         assert len(result) > 0
+
+
+class TestReadVectorFile:
+    """測試 _read_vector_file 方法。"""
+
+    def test_reads_geometry_and_attributes(self, tmp_path):
+        """測試只讀取指定欄位，缺值與空幾何皆保留。"""
+        path = tmp_path / "sample.geojson"
+        features = [
+            {
+                "type": "Feature",
+                "properties": {"name": "甲", "code": "A", "extra": 1},
+                "geometry": {"type": "Point", "coordinates": [121.5, 25.0]},
+            },
+            {
+                "type": "Feature",
+                "properties": {"name": None, "code": "B", "extra": 2},
+                "geometry": None,
+            },
+        ]
+        path.write_text(
+            json.dumps({"type": "FeatureCollection", "features": features}),
+            encoding="utf-8",
+        )
+
+        gdf, attributes = GeoDataHandler._read_vector_file(
+            str(path), columns=["name", "code"]
+        )
+
+        assert gdf.crs.to_epsg() == 4326
+        assert gdf.geometry.iloc[0].x == 121.5
+        assert gdf.geometry.iloc[1] is None
+        assert attributes.columns == ["name", "code"]
+        assert attributes.schema == {"name": pl.String, "code": pl.String}
+        assert attributes["name"].to_list() == ["甲", None]
+
+
+class TestBuildCoordinateFrame:
+    """測試 _build_coordinate_frame 方法。"""
+
+    def test_nan_becomes_null(self):
+        """測試座標排在屬性欄位之前，且 NaN 轉為 null。"""
+        attributes = pl.DataFrame({"admin_1": ["臺北市", "新北市"]})
+
+        result = GeoDataHandler._build_coordinate_frame(
+            np.array([121.5, np.nan]), np.array([25.0, np.nan]), attributes
+        )
+
+        assert result.columns == ["latitude", "longitude", "admin_1"]
+        assert result["latitude"].to_list() == [25.0, None]
+        assert result["longitude"].to_list() == [121.5, None]
+
+
+class TestBuildCitiesDataframe:
+    """測試 build_cities_dataframe 方法。"""
+
+    def test_matches_cities_schema(self):
+        """測試輸出欄位與型態符合 CITIES_SCHEMA，並帶入預設值。"""
+        from core.geodata.south_korea import SouthKoreaGeoDataHandler
+
+        df = pl.DataFrame(
+            {
+                "geoname_id": [1000],
+                "admin_2": ["종로구"],
+                "latitude": [37.5],
+                "longitude": [127.0],
+                "admin1_code_mapped": ["01"],
+            }
+        )
+
+        result = SouthKoreaGeoDataHandler.build_cities_dataframe(df)
+
+        assert result.schema == GeoDataHandler.CITIES_SCHEMA
+        row = result.row(0, named=True)
+        assert row["geoname_id"] == "1000"
+        assert row["name"] == row["asciiname"] == "종로구"
+        assert row["latitude"] == "37.5"
+        assert row["admin1_code"] == "01"
+        assert row["country_code"] == "KR"
+        assert row["population"] == 0
+        assert row["alternatenames"] is None
@@ -0,0 +1,70 @@
+"""日本地理資料處理器的單元測試。"""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+from core.geodata.japan import JapanGeoDataHandler
+
+
+@pytest.fixture
+def handler() -> JapanGeoDataHandler:
+    """建立不需初始化的處理器實例。"""
+    return JapanGeoDataHandler.__new__(JapanGeoDataHandler)
+
+
+@pytest.fixture
+def sample_gdf() -> gpd.GeoDataFrame:
+    """提供橫跨 UTM 52N～55N 的小型多邊形（WGS84）。"""
+    polygons = [
+        Polygon(
+            [(lon, lat), (lon + 0.1, lat), (lon + 0.1, lat + 0.1), (lon, lat + 0.1)]
+        )
+        for lon, lat in [
+            (130.4, 33.5),  # 福岡（52N）
+            (135.5, 34.6),  # 大阪（53N）
+            (137.95, 36.0),  # 跨越 138°E
+            (139.7, 35.6),  # 東京（54N）
+            (141.3, 43.0),  # 札幌（54N）
+            (144.3, 43.0),  # 釧路（55N）
+        ]
+    ]
+    return gpd.GeoDataFrame(geometry=polygons, crs=4326)
+
+
+class TestCalculateCentroidsUtm:
+    """測試 _calculate_centroids_utm 方法。"""
+
+    def test_chunked_matches_single_chunk(self, handler, sample_gdf):
+        """測試切成多個區塊並行計算的結果與單一區塊相同。"""
+        expected = handler._calculate_centroids_utm(sample_gdf)
+
+        handler.CENTROID_CHUNK_SIZE = 1
+        result = handler._calculate_centroids_utm(sample_gdf)
+
+        np.testing.assert_array_equal(
+            result["longitude"].to_numpy(), expected["longitude"].to_numpy()
+        )
+        np.testing.assert_array_equal(
+            result["latitude"].to_numpy(), expected["latitude"].to_numpy()
+        )
+
+    def test_centroids_inside_polygons(self, handler, sample_gdf):
+        """測試中心點落在各自的多邊形內。"""
+        result = handler._calculate_centroids_utm(sample_gdf)
+
+        for polygon, lon, lat in zip(
+            sample_gdf.geometry, result["longitude"], result["latitude"]
+        ):
+            assert polygon.bounds[0] < lon < polygon.bounds[2]
+            assert polygon.bounds[1] < lat < polygon.bounds[3]
+
+    def test_empty_geodataframe(self, handler):
+        """測試空的 GeoDataFrame。"""
+        result = handler._calculate_centroids_utm(
+            gpd.GeoDataFrame(geometry=[], crs=4326)
+        )
+
+        assert len(result) == 0
+        assert {"longitude", "latitude"} <= set(result.columns)
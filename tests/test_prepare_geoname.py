@@ -0,0 +1,81 @@
+"""地理名稱資料下載模組的單元測試。"""
+
+import os
+import stat
+
+import pytest
+import requests
+
+from core import prepare_geoname
+from core.prepare_geoname import download_file
+
+
+class FakeResponse:
+    """模擬 requests 串流回應，可在傳送部分內容後中斷。"""
+
+    def __init__(self, body: bytes, fail: bool = False):
+        self.body = body
+        self.fail = fail
+        self.status_code = 200
+        self.headers = {"ETag": '"v1"'}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield self.body[:4]
+        if self.fail:
+            raise requests.exceptions.ChunkedEncodingError("中斷")
+        yield self.body[4:]
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """將共用 Session 的 GET 請求替換為回傳指定的假回應。"""
+
+    def _serve(response: FakeResponse):
+        monkeypatch.setattr(
+            prepare_geoname._SESSION, "get", lambda url, **kwargs: response
+        )
+
+    return _serve
+
+
+class TestDownloadFile:
+    """測試 download_file 函式。"""
+
+    def test_new_file_uses_umask_mode(self, tmp_path, serve, monkeypatch):
+        """測試新下載的檔案依 umask 設定權限，而非暫存檔的 0600。"""
+        monkeypatch.setattr(prepare_geoname, "_UMASK", 0o022)
+        serve(FakeResponse(b"admin1 codes"))
+        output_path = tmp_path / "admin1CodesASCII.txt"
+
+        validators = download_file("https://example.com/a.txt", str(output_path))
+
+        assert output_path.read_bytes() == b"admin1 codes"
+        assert stat.S_IMODE(os.stat(output_path).st_mode) == 0o644
+        assert validators["etag"] == '"v1"'
+
+    def test_existing_file_keeps_mode(self, tmp_path, serve):
+        """測試覆蓋既有檔案時沿用其原本的權限。"""
+        output_path = tmp_path / "admin2Codes.txt"
+        output_path.write_bytes(b"old")
+        os.chmod(output_path, 0o640)
+        serve(FakeResponse(b"new admin2 codes"))
+
+        download_file("https://example.com/b.txt", str(output_path))
+
+        assert output_path.read_bytes() == b"new admin2 codes"
+        assert stat.S_IMODE(os.stat(output_path).st_mode) == 0o640
+
+    def test_failed_transfer_keeps_existing_file(self, tmp_path, serve):
+        """測試傳輸中斷時保留既有檔案，且不留下暫存檔。"""
+        output_path = tmp_path / "admin1CodesASCII.txt"
+        output_path.write_bytes(b"old")
+        serve(FakeResponse(b"partial-content", fail=True))
+
+        with pytest.raises(SystemExit):
+            download_file("https://example.com/a.txt", str(output_path))
+
+        assert output_path.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["admin1CodesASCII.txt"]
@@ -0,0 +1,116 @@
+"""座標投影工具的單元測試。"""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from pyproj.exceptions import CRSError
+from shapely.geometry import Point, Polygon
+
+from core.utils.projection import (
+    calculate_projected_centroids,
+    get_transformer,
+    transform_geometries,
+    transform_geometry_array,
+)
+
+
+@pytest.fixture
+def sample_geoseries() -> gpd.GeoSeries:
+    """提供位於首爾附近的多邊形與點（WGS84）。"""
+    return gpd.GeoSeries(
+        [
+            Polygon([(126.9, 37.5), (127.0, 37.5), (127.0, 37.6), (126.9, 37.6)]),
+            Point(127.5, 36.0),
+        ],
+        index=[10, 20],
+        crs=4326,
+    )
+
+
+class TestGetTransformer:
+    """測試 get_transformer 函式。"""
+
+    def test_returns_cached_instance(self):
+        """測試相同參數會取得同一個 Transformer。"""
+        assert get_transformer(4326, 32652) is get_transformer(4326, 32652)
+
+    def test_always_xy_order(self):
+        """測試座標順序為 (經度, 緯度)。"""
+        transformer = get_transformer(4326, 4326)
+        x, y = transformer.transform(127.0, 37.5)
+        assert x == pytest.approx(127.0)
+        assert y == pytest.approx(37.5)
+
+    def test_invalid_crs(self):
+        """測試無效的 EPSG 代碼會拋出例外。"""
+        with pytest.raises(CRSError):
+            get_transformer(4326, -1)
+
+
+class TestTransformGeometryArray:
+    """測試 transform_geometry_array 函式。"""
+
+    def test_matches_to_crs(self, sample_geoseries):
+        """測試投影幾何陣列的結果與 GeoSeries.to_crs 一致。"""
+        expected = sample_geoseries.to_crs(epsg=32652)
+        result = transform_geometry_array(sample_geoseries.to_numpy(), 4326, 32652)
+
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(
+            gpd.GeoSeries(result).get_coordinates().to_numpy(),
+            expected.get_coordinates().to_numpy(),
+        )
+
+
+class TestCalculateProjectedCentroids:
+    """測試 calculate_projected_centroids 函式。"""
+
+    def test_matches_geoseries_centroid(self, sample_geoseries):
+        """測試結果與 GeoSeries 投影後計算中心點再轉回一致。"""
+        expected = sample_geoseries.to_crs(epsg=32652).centroid.to_crs(epsg=4326)
+
+        xs, ys = calculate_projected_centroids(sample_geoseries.to_numpy(), 4326, 32652)
+
+        np.testing.assert_allclose(xs, expected.x.to_numpy())
+        np.testing.assert_allclose(ys, expected.y.to_numpy())
+
+    def test_source_already_projected(self, sample_geoseries):
+        """測試來源已是投影座標系統時，結果與先投影再計算一致。"""
+        projected = sample_geoseries.to_crs(epsg=32652)
+        expected = calculate_projected_centroids(
+            sample_geoseries.to_numpy(), 4326, 32652, dst_crs=4326
+        )
+
+        xs, ys = calculate_projected_centroids(
+            projected.to_numpy(), projected.crs, 32652, dst_crs=4326
+        )
+
+        np.testing.assert_allclose(xs, expected[0])
+        np.testing.assert_allclose(ys, expected[1])
+
+
+class TestTransformGeometries:
+    """測試 transform_geometries 函式。"""
+
+    def test_matches_to_crs(self, sample_geoseries):
+        """測試結果與 GeoSeries.to_crs 一致。"""
+        expected = sample_geoseries.to_crs(epsg=32652)
+        result = transform_geometries(sample_geoseries, 32652)
+
+        np.testing.assert_allclose(
+            result.get_coordinates().to_numpy(),
+            expected.get_coordinates().to_numpy(),
+        )
+
+    def test_keeps_index_and_sets_crs(self, sample_geoseries):
+        """測試保留原索引並設定目標座標系統。"""
+        result = transform_geometries(sample_geoseries, 32652)
+
+        assert list(result.index) == [10, 20]
+        assert result.crs.to_epsg() == 32652
+
+    def test_empty_geoseries(self):
+        """測試空的 GeoSeries。"""
+        result = transform_geometries(gpd.GeoSeries([], crs=4326), 32652)
+
+        assert len(result) == 0
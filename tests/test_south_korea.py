@@ -0,0 +1,191 @@
+"""南韓地理資料處理器的單元測試。"""
+
+import geopandas as gpd
+import numpy as np
+import polars as pl
+import pytest
+from shapely.geometry import Polygon
+
+from core.geodata.south_korea import SouthKoreaGeoDataHandler
+from core.utils.projection import calculate_projected_centroids
+
+
+@pytest.fixture
+def handler() -> SouthKoreaGeoDataHandler:
+    """建立不需初始化翻譯器的處理器實例。"""
+    return SouthKoreaGeoDataHandler.__new__(SouthKoreaGeoDataHandler)
+
+
+class TestCalculateCentroidsUtm:
+    """測試 _calculate_centroids_utm 方法。"""
+
+    def test_uses_utm_zone_of_centroid(self, handler):
+        """測試橫跨 126°E 的多邊形依中心點經度選用 UTM 區。"""
+        # 中心點經度分別約為 125.95°E（51N）與 126.05°E（52N）
+        west = Polygon([(125.8, 37.0), (126.1, 37.0), (126.1, 37.1), (125.8, 37.1)])
+        east = Polygon([(125.9, 36.0), (126.2, 36.0), (126.2, 36.1), (125.9, 36.1)])
+        gdf = gpd.GeoDataFrame(geometry=[west, east], crs=4326)
+
+        result = handler._calculate_centroids_utm(gdf)
+
+        for i, utm_epsg in enumerate([32651, 32652]):
+            expected_lons, expected_lats = calculate_projected_centroids(
+                gdf.geometry.to_numpy(), 4326, utm_epsg
+            )
+            assert result["longitude"].iloc[i] == expected_lons[i]
+            assert result["latitude"].iloc[i] == expected_lats[i]
+
+    def test_single_zone_matches_full_path(self, handler):
+        """測試單一 UTM 區的快速路徑與完整流程結果一致。"""
+        seoul = Polygon([(126.9, 37.5), (127.1, 37.5), (127.1, 37.7), (126.9, 37.7)])
+        busan = Polygon([(129.0, 35.1), (129.1, 35.1), (129.1, 35.2), (129.0, 35.2)])
+        # 位於 51N 的白翎島，使整體範圍跨越 UTM 區而走完整流程
+        baengnyeong = Polygon(
+            [(124.6, 37.9), (124.7, 37.9), (124.7, 38.0), (124.6, 38.0)]
+        )
+
+        fast = handler._calculate_centroids_utm(
+            gpd.GeoDataFrame(geometry=[seoul, busan], crs=4326)
+        )
+        full = handler._calculate_centroids_utm(
+            gpd.GeoDataFrame(geometry=[seoul, busan, baengnyeong], crs=4326)
+        )
+
+        np.testing.assert_array_equal(
+            fast["longitude"].to_numpy(), full["longitude"].to_numpy()[:2]
+        )
+        np.testing.assert_array_equal(
+            fast["latitude"].to_numpy(), full["latitude"].to_numpy()[:2]
+        )
+
+    def test_falls_back_outside_korea_zones(self, handler):
+        """測試中心點超出 51N/52N 範圍時改用通用公式。"""
+        # 中心點約為 119.95°E（50N）與 127.0°E（52N）
+        west = Polygon([(119.9, 33.0), (120.0, 33.0), (120.0, 33.1), (119.9, 33.1)])
+        seoul = Polygon([(126.9, 37.5), (127.1, 37.5), (127.1, 37.7), (126.9, 37.7)])
+        gdf = gpd.GeoDataFrame(geometry=[west, seoul], crs=4326)
+
+        result = handler._calculate_centroids_utm(gdf)
+
+        for i, utm_epsg in enumerate([32650, 32652]):
+            expected_lons, expected_lats = calculate_projected_centroids(
+                gdf.geometry.to_numpy(), 4326, utm_epsg
+            )
+            assert result["longitude"].iloc[i] == expected_lons[i]
+            assert result["latitude"].iloc[i] == expected_lats[i]
+
+    def test_empty_geodataframe(self, handler):
+        """測試空的 GeoDataFrame。"""
+        gdf = gpd.GeoDataFrame(geometry=[], crs=4326)
+
+        result = handler._calculate_centroids_utm(gdf)
+
+        assert len(result) == 0
+        assert {"longitude", "latitude"} <= set(result.columns)
+
+
+class TestBuildAdmin3Expr:
+    """測試 _build_admin3_expr 方法。"""
+
+    def test_strips_sidonm_and_sggnm(self):
+        """測試移除開頭的 sidonm 與 sggnm。"""
+        df = pl.DataFrame(
+            {
+                "adm_nm": ["서울특별시 종로구 사직동", "세종특별자치시 조치원읍"],
+                "sidonm": ["서울특별시", "세종특별자치시"],
+                "sggnm": ["종로구", "세종시"],
+            }
+        )
+
+        result = df.select(SouthKoreaGeoDataHandler._build_admin3_expr())
+
+        assert result["admin_3"].to_list() == ["사직동", "조치원읍"]
+
+    def test_matches_legacy_replace(self):
+        """測試結果與原本逐列 str.replace 的做法一致。"""
+        df = pl.DataFrame(
+            {
+                "adm_nm": [
+                    "서울특별시 종로구 사직동",
+                    "부산광역시 해운대구 우동",
+                    "경기도 수원시장안구 파장동",
+                    "강원특별자치도 춘천시 신북읍",
+                    "세종특별자치시 세종시 조치원읍",
+                ],
+                "sidonm": [
+                    "서울특별시",
+                    "부산광역시",
+                    "경기도",
+                    "강원특별자치도",
+                    "세종특별자치시",
+                ],
+                "sggnm": ["종로구", "해운대구", "수원시장안구", "춘천시", "세종시"],
+            }
+        )
+
+        result = df.select(SouthKoreaGeoDataHandler._build_admin3_expr())
+
+        legacy = [
+            row["adm_nm"].replace(row["sidonm"], "").replace(row["sggnm"], "").strip()
+            for row in df.iter_rows(named=True)
+        ]
+        assert result["admin_3"].to_list() == legacy
+
+
+class TestNormalizeCityDistrictHierarchy:
+    """測試 _normalize_city_district_hierarchy 方法。"""
+
+    def test_splits_city_and_district(self, handler):
+        """測試拆分「市＋區」合併名稱並將原 admin_3 下移到 admin_4。"""
+        df = pl.DataFrame(
+            {
+                "sggnm": ["수원시장안구", "창원시마산합포구", "종로구", "춘천시", ""],
+                "admin_3": ["파장동", "합포동", "사직동", "신북읍", "조치원읍"],
+            }
+        )
+
+        result = handler._normalize_city_district_hierarchy(df)
+
+        assert result["sggnm"].to_list() == ["수원시", "창원시", "종로구", "춘천시", ""]
+        assert result["admin_3"].to_list() == [
+            "장안구",
+            "마산합포구",
+            "사직동",
+            "신북읍",
+            "조치원읍",
+        ]
+        assert result["admin_4"].to_list() == ["파장동", "합포동", None, None, None]
+        assert "_city_part" not in result.columns
+
+
+class TestBuildCandidateFilter:
+    """測試 _build_candidate_filter 方法。"""
+
+    def test_excludes_keyword_in_any_label(self):
+        """測試任一語言標籤包含排除關鍵字（不分大小寫）即排除。"""
+        candidate_filter = SouthKoreaGeoDataHandler._build_candidate_filter()
+
+        council = {"qid": "Q1", "labels": {"ko": "종로구", "en": "Jongno Council"}}
+        office = {"qid": "Q2", "labels": {"ko": "종로구청"}}
+
+        assert candidate_filter("종로구", council) is False
+        assert candidate_filter("종로구", office) is False
+
+    def test_keeps_regular_place_names(self):
+        """測試一般地名（含單字「청」）不會被排除。"""
+        candidate_filter = SouthKoreaGeoDataHandler._build_candidate_filter()
+
+        cheongdo = {"qid": "Q3", "labels": {"ko": "청도군", "zh-tw": "清道郡"}}
+
+        assert candidate_filter("청도군", cheongdo) is True
+        assert candidate_filter("청도군", {"qid": "Q4"}) is True
+
+    def test_reuses_decision_for_same_qid(self):
+        """測試同一個 QID 的判定結果會被重複使用。"""
+        candidate_filter = SouthKoreaGeoDataHandler._build_candidate_filter()
+
+        office = {"qid": "Q5", "labels": {"ko": "종로구청"}}
+
+        assert candidate_filter("종로구", office) is False
+        # 第二次只提供 QID，仍沿用先前的排除判定
+        assert candidate_filter("중구", {"qid": "Q5"}) is False
@@ -0,0 +1,116 @@
+"""地名翻譯模組的單元測試。"""
+
+import polars as pl
+import pytest
+
+from core.schemas import GEODATA_SCHEMA
+
+pytest.importorskip("opencc")
+
+from core.translate import (
+    build_conversion_map,
+    build_metadata_translations,
+    extract_chinese_names,
+    load_metadata_list,
+)
+
+
+def _make_metadata(admin_2: list[str]) -> pl.DataFrame:
+    """建立只有 admin_2 不同的 metadata 資料表。"""
+    return pl.DataFrame(
+        {
+            "latitude": [str(i) for i in range(len(admin_2))],
+            "longitude": [str(i) for i in range(len(admin_2))],
+            "country": "泰國",
+            "admin_1": "",
+            "admin_2": admin_2,
+            "admin_3": "",
+            "admin_4": "",
+        },
+        schema=GEODATA_SCHEMA,
+    )
+
+
+class TestBuildMetadataTranslations:
+    """測試 build_metadata_translations 函式。"""
+
+    def test_converts_and_filters_names(self):
+        """測試簡體轉為繁體、繁體保留、非中文名稱設為 None。"""
+        meta_data = {"TH": _make_metadata(["东区", "臺中", "Don Sak"])}
+
+        result = build_metadata_translations(meta_data)
+
+        assert result["country_code"].to_list() == ["TH", "TH", "TH"]
+        assert result["translated_name"].to_list() == ["東區", "臺中", None]
+
+    def test_keeps_first_duplicate_location(self):
+        """測試同一國家重複的座標只保留第一筆。"""
+        metadata = _make_metadata(["臺中", "臺南"]).with_columns(
+            pl.lit("0").alias("latitude"), pl.lit("0").alias("longitude")
+        )
+
+        result = build_metadata_translations({"TH": metadata})
+
+        assert result.height == 1
+        assert result["translated_name"].item() == "臺中"
+
+    def test_empty_metadata(self):
+        """測試沒有任何 metadata 時回傳空的對照表。"""
+        result = build_metadata_translations({})
+
+        assert result.is_empty()
+        assert result.columns == [
+            "country_code",
+            "latitude",
+            "longitude",
+            "translated_name",
+        ]
+
+
+class TestExtractChineseNames:
+    """測試 extract_chinese_names 函式。"""
+
+    def test_prefers_traditional_then_simplified(self):
+        """測試依繁體、簡體（轉繁體）、含中文的順序選出名稱。"""
+        alternatenames = pl.Series(
+            ["Taipei,东区,臺中", "Tokyo,东区,Abc", "Ulsan,A區B", "Paris,London", None]
+        )
+
+        result = extract_chinese_names(alternatenames)
+
+        assert result.to_list() == ["臺中", "東區", "A區B", None, None]
+
+
+class TestBuildConversionMap:
+    """測試 build_conversion_map 函式。"""
+
+    def test_converts_each_unique_name_once(self):
+        """測試每個不重複的名稱只轉換一次，且略過 None。"""
+        calls = []
+
+        def convert(name):
+            calls.append(name)
+            return name.upper()
+
+        result = build_conversion_map(pl.Series(["a", "b", "a", None]), convert)
+
+        assert result == {"a": "A", "b": "B"}
+        assert sorted(calls) == ["a", "b"]
+
+
+class TestLoadMetadataList:
+    """測試 load_metadata_list 函式。"""
+
+    def test_loads_each_csv_by_stem(self, tmp_path):
+        """測試以檔名為鍵載入各 CSV，並將 admin 欄位缺值轉為空字串。"""
+        _make_metadata(["臺中"]).write_csv(tmp_path / "TH.csv")
+        _make_metadata(["東區", "臺南"]).with_columns(
+            pl.lit(None, dtype=pl.String).alias("admin_3")
+        ).write_csv(tmp_path / "JP.csv")
+
+        result = load_metadata_list(str(tmp_path))
+
+        assert sorted(result) == ["JP", "TH"]
+        assert result["JP"]["admin_2"].to_list() == ["東區", "臺南"]
+        assert result["JP"]["admin_3"].to_list() == ["", ""]
+        assert result["TH"].schema == GEODATA_SCHEMA
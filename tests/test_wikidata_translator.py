@@ -0,0 +1,48 @@
+"""Wikidata 翻譯工具的單元測試。"""
+
+from core.utils.wikidata_translator import (
+    AdminLevel,
+    TranslationCacheStore,
+    TranslationItem,
+)
+
+
+def _make_store(tmp_path) -> TranslationCacheStore:
+    return TranslationCacheStore(
+        source_lang="ko",
+        target_lang="zh-tw",
+        cache_path=tmp_path / "cache.json",
+    )
+
+
+def _make_item() -> TranslationItem:
+    return TranslationItem.from_values(
+        level=AdminLevel.ADMIN_1,
+        original_name="서울특별시",
+        source_lang="ko",
+        target_lang="zh-tw",
+        parent_chain=("KR",),
+    )
+
+
+class TestTranslationCacheStoreFlush:
+    """測試 TranslationCacheStore.flush_if_needed 方法。"""
+
+    def test_skips_write_when_clean(self, tmp_path):
+        """測試沒有異動時即使 force=True 也不寫入快取檔。"""
+        store = _make_store(tmp_path)
+
+        store.flush_if_needed(force=True)
+
+        assert not store.cache_path.exists()
+
+    def test_force_writes_pending_changes(self, tmp_path):
+        """測試有異動時 force=True 會寫入快取檔，且重新載入後可命中。"""
+        store = _make_store(tmp_path)
+        item = _make_item()
+        store.set_translation(item, {"translated": "首爾特別市"}, None)
+
+        store.flush_if_needed(force=True)
+
+        reloaded = _make_store(tmp_path)
+        assert reloaded.get_translation(item)["translated"] == "首爾特別市"